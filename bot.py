@@ -15,8 +15,8 @@ from aiogram.fsm.storage.memory import MemoryStorage
 
 from config import BOT_TOKEN, BOT_NAME, ADMIN_TELEGRAM_IDS
 from database.db import get_db, close_db
-from handlers import get_all_routers
-from middleware import AdminAuthMiddleware, AuditLoggerMiddleware
+from handlers import get_all_routers, admin_router
+from middleware import AdminAuthMiddleware, AuditLoggerMiddleware, flush_audit_log
 
 # Configure logging
 logging.basicConfig(
@@ -79,6 +79,7 @@ async def on_startup(bot: Bot):
 
 async def on_shutdown(bot: Bot):
     """Run on bot shutdown."""
+    await flush_audit_log()
     await close_db()
     logger.info("Database connection closed")
     logger.info("Bot stopped")
@@ -101,11 +102,12 @@ async def main():
     # Note: For production, consider using Redis storage for persistence
     dp = Dispatcher(storage=MemoryStorage())
 
-    # Register middleware (before routers)
-    dp.message.middleware(AdminAuthMiddleware())
-    dp.callback_query.middleware(AdminAuthMiddleware())
-    dp.message.middleware(AuditLoggerMiddleware())
-    dp.callback_query.middleware(AuditLoggerMiddleware())
+    # Register admin middleware on the admin router only, so regular
+    # user updates skip the admin lookup and audit bookkeeping
+    admin_router.message.middleware(AdminAuthMiddleware())
+    admin_router.callback_query.middleware(AdminAuthMiddleware())
+    admin_router.message.middleware(AuditLoggerMiddleware())
+    admin_router.callback_query.middleware(AuditLoggerMiddleware())
     logger.info("Admin middleware registered")
 
     # Register startup/shutdown handlers
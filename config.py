@@ -24,9 +24,9 @@ SUPPORT_USERNAME = "@tradetesttt_bot"
 WELCOME_IMAGE_PATH = "assets/images/menu.jpg"
 
 # Admin Configuration
-ADMIN_TELEGRAM_IDS = [
+ADMIN_TELEGRAM_IDS = frozenset(
     int(id.strip()) for id in os.getenv("ADMIN_TELEGRAM_IDS", "").split(",") if id.strip()
-]
+)
 SUPER_ADMIN_ID = int(os.getenv("SUPER_ADMIN_ID", "0")) if os.getenv("SUPER_ADMIN_ID") else None
 
 # Listing Settings
@@ -106,6 +106,7 @@ MESSAGES = {
     "added_to_favorites": "❤️ Добавлено в избранное!",
     "removed_from_favorites": "💔 Удалено из избранного.",
     "operation_cancelled": "❌ Операция отменена.",
+    "outdated_button": "⚠️ Эта кнопка устарела. Откройте меню заново.",
 }
 
 # Payment Configuration (placeholder for future integration)
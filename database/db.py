@@ -189,6 +189,9 @@ class Database:
             CREATE INDEX IF NOT EXISTS idx_listings_category ON listings(category);
             CREATE INDEX IF NOT EXISTS idx_listings_status ON listings(status);
             CREATE INDEX IF NOT EXISTS idx_listings_price ON listings(price);
+            -- Indexes matching Listing.search filters and newest-first ordering
+            CREATE INDEX IF NOT EXISTS idx_listings_status_created ON listings(status, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_listings_active_category_created ON listings(category, created_at DESC) WHERE status = 'active';
             CREATE INDEX IF NOT EXISTS idx_favorites_user ON favorites(user_id);
             CREATE INDEX IF NOT EXISTS idx_messages_receiver ON messages(receiver_id);
             CREATE INDEX IF NOT EXISTS idx_messages_sender ON messages(sender_id);
@@ -6,7 +6,7 @@ from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.context import FSMContext
 from database.models import Listing, User
-from database.admin_models import AdminUser, AdminAuditLog
+from database.admin_models import AdminUser
 from keyboards.admin_keyboards import (
     get_admin_listings_keyboard,
     get_admin_listing_actions_keyboard,
@@ -17,7 +17,7 @@ from keyboards.admin_keyboards import (
 from utils.decorators import require_admin, require_permission
 from utils.admin_helpers import format_admin_listing_text
 from utils.helpers import safe_edit_or_answer
-from states.states import AdminStates
+from states import AdminStates
 from config import ADMIN_PAGE_SIZE
 import logging
 
@@ -176,7 +176,7 @@ async def admin_listing_flag_start(callback: CallbackQuery, admin: AdminUser, st
 
 @router.message(AdminStates.flagging_listing)
 @require_admin
-async def admin_listing_flag_reason(message: Message, admin: AdminUser, state: FSMContext):
+async def admin_listing_flag_reason(message: Message, admin: AdminUser, state: FSMContext, audit_actions: list):
     """Receive flag reason and flag the listing."""
     data = await state.get_data()
     listing_id = data.get("target_listing_id")
@@ -195,13 +195,12 @@ async def admin_listing_flag_reason(message: Message, admin: AdminUser, state: F
 
     await listing.update(flagged=1, flag_reason=reason)
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="listing_flag",
-        target_type="listing",
-        target_id=listing.id,
-        details={"reason": reason, "listing_title": listing.title},
-    )
+    audit_actions.append({
+        "action": "listing_flag",
+        "target_type": "listing",
+        "target_id": listing.id,
+        "details": {"reason": reason, "listing_title": listing.title},
+    })
 
     logger.info(f"Admin {admin.user_id} flagged listing {listing.id}: {reason}")
 
@@ -215,7 +214,7 @@ async def admin_listing_flag_reason(message: Message, admin: AdminUser, state: F
 @router.callback_query(F.data.startswith("admin_listing_unflag:"))
 @require_admin
 @require_permission("manage_listings")
-async def admin_listing_unflag(callback: CallbackQuery, admin: AdminUser):
+async def admin_listing_unflag(callback: CallbackQuery, admin: AdminUser, audit_actions: list):
     """Remove flag from a listing."""
     try:
         listing_id = int(callback.data.split(":")[-1])
@@ -230,13 +229,12 @@ async def admin_listing_unflag(callback: CallbackQuery, admin: AdminUser):
 
     await listing.update(flagged=0, flag_reason=None)
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="listing_unflag",
-        target_type="listing",
-        target_id=listing.id,
-        details={"listing_title": listing.title},
-    )
+    audit_actions.append({
+        "action": "listing_unflag",
+        "target_type": "listing",
+        "target_id": listing.id,
+        "details": {"listing_title": listing.title},
+    })
 
     logger.info(f"Admin {admin.user_id} unflagged listing {listing.id}")
 
@@ -277,7 +275,7 @@ async def admin_listing_delete_start(callback: CallbackQuery, admin: AdminUser):
 @router.callback_query(F.data.startswith("admin_confirm:listing_delete:"))
 @require_admin
 @require_permission("delete_any_listing")
-async def admin_listing_delete_confirm(callback: CallbackQuery, admin: AdminUser):
+async def admin_listing_delete_confirm(callback: CallbackQuery, admin: AdminUser, audit_actions: list):
     """Execute listing deletion."""
     try:
         listing_id = int(callback.data.split(":")[-1])
@@ -293,13 +291,12 @@ async def admin_listing_delete_confirm(callback: CallbackQuery, admin: AdminUser
     title = listing.title
     await listing.delete()
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="listing_delete",
-        target_type="listing",
-        target_id=listing.id,
-        details={"listing_title": title, "seller_id": listing.user_id},
-    )
+    audit_actions.append({
+        "action": "listing_delete",
+        "target_type": "listing",
+        "target_id": listing.id,
+        "details": {"listing_title": title, "seller_id": listing.user_id},
+    })
 
     logger.info(f"Admin {admin.user_id} deleted listing {listing.id}")
 
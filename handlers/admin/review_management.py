@@ -5,7 +5,7 @@ from math import ceil
 from aiogram import Router, F
 from aiogram.types import CallbackQuery
 from database.models import User, Review
-from database.admin_models import AdminUser, AdminAuditLog
+from database.admin_models import AdminUser
 from keyboards.admin_keyboards import (
     get_admin_reviews_keyboard,
     get_admin_review_actions_keyboard,
@@ -165,7 +165,7 @@ async def admin_review_delete_start(callback: CallbackQuery, admin: AdminUser):
 @router.callback_query(F.data.startswith("admin_confirm:review_delete:"))
 @require_admin
 @require_permission("manage_listings")
-async def admin_review_delete_confirm(callback: CallbackQuery, admin: AdminUser):
+async def admin_review_delete_confirm(callback: CallbackQuery, admin: AdminUser, audit_actions: list):
     """Execute review deletion."""
     try:
         review_id = int(callback.data.split(":")[-1])
@@ -183,17 +183,16 @@ async def admin_review_delete_confirm(callback: CallbackQuery, admin: AdminUser)
     success = await Review.delete(review_id, seller_id)
 
     if success:
-        await AdminAuditLog.create(
-            admin_id=admin.user_id,
-            action="review_delete",
-            target_type="review",
-            target_id=review_id,
-            details={
+        audit_actions.append({
+            "action": "review_delete",
+            "target_type": "review",
+            "target_id": review_id,
+            "details": {
                 "seller_id": seller_id,
                 "reviewer_id": review.reviewer_id,
                 "rating": rating,
             },
-        )
+        })
 
         logger.info(f"Admin {admin.user_id} deleted review {review_id}")
 
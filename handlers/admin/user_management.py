@@ -6,7 +6,7 @@ from aiogram import Router, F
 from aiogram.types import CallbackQuery, Message
 from aiogram.fsm.context import FSMContext
 from database.models import User
-from database.admin_models import AdminUser, AdminAuditLog, UserWarning
+from database.admin_models import AdminUser, UserWarning
 from keyboards.admin_keyboards import (
     get_admin_users_keyboard,
     get_admin_user_actions_keyboard,
@@ -18,7 +18,7 @@ from keyboards.admin_keyboards import (
 from utils.decorators import require_admin, require_permission
 from utils.admin_helpers import format_admin_user_text, format_admin_warning_text
 from utils.helpers import safe_edit_or_answer
-from states.states import AdminStates
+from states import AdminStates
 from config import ADMIN_PAGE_SIZE
 import logging
 
@@ -249,7 +249,7 @@ async def admin_user_block_confirm(callback: CallbackQuery, admin: AdminUser, st
 
 @router.message(AdminStates.blocking_user)
 @require_admin
-async def admin_user_block_reason(message: Message, admin: AdminUser, state: FSMContext):
+async def admin_user_block_reason(message: Message, admin: AdminUser, state: FSMContext, audit_actions: list):
     """Receive block reason and execute the block."""
     data = await state.get_data()
     user_id = data.get("target_user_id")
@@ -268,13 +268,12 @@ async def admin_user_block_reason(message: Message, admin: AdminUser, state: FSM
 
     await user.update(is_active=False, suspension_reason=reason)
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="user_block",
-        target_type="user",
-        target_id=user.id,
-        details={"reason": reason, "user_name": user.display_name},
-    )
+    audit_actions.append({
+        "action": "user_block",
+        "target_type": "user",
+        "target_id": user.id,
+        "details": {"reason": reason, "user_name": user.display_name},
+    })
 
     logger.info(f"Admin {admin.user_id} blocked user {user.id}: {reason}")
 
@@ -313,7 +312,7 @@ async def admin_user_unblock_start(callback: CallbackQuery, admin: AdminUser):
 @router.callback_query(F.data.startswith("admin_confirm:user_unblock:"))
 @require_admin
 @require_permission("block_users")
-async def admin_user_unblock_confirm(callback: CallbackQuery, admin: AdminUser):
+async def admin_user_unblock_confirm(callback: CallbackQuery, admin: AdminUser, audit_actions: list):
     """Execute unblock immediately."""
     try:
         user_id = int(callback.data.split(":")[-1])
@@ -328,13 +327,12 @@ async def admin_user_unblock_confirm(callback: CallbackQuery, admin: AdminUser):
 
     await user.update(is_active=True, suspension_reason=None)
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="user_unblock",
-        target_type="user",
-        target_id=user.id,
-        details={"user_name": user.display_name},
-    )
+    audit_actions.append({
+        "action": "user_unblock",
+        "target_type": "user",
+        "target_id": user.id,
+        "details": {"user_name": user.display_name},
+    })
 
     logger.info(f"Admin {admin.user_id} unblocked user {user.id}")
 
@@ -439,7 +437,7 @@ async def admin_user_warn_severity(callback: CallbackQuery, admin: AdminUser, st
 
 @router.message(AdminStates.warning_user)
 @require_admin
-async def admin_user_warn_reason(message: Message, admin: AdminUser, state: FSMContext):
+async def admin_user_warn_reason(message: Message, admin: AdminUser, state: FSMContext, audit_actions: list):
     """Receive warning reason and create the warning."""
     data = await state.get_data()
     user_id = data.get("target_user_id")
@@ -464,18 +462,17 @@ async def admin_user_warn_reason(message: Message, admin: AdminUser, state: FSMC
         severity=severity,
     )
 
-    await AdminAuditLog.create(
-        admin_id=admin.user_id,
-        action="user_warn",
-        target_type="user",
-        target_id=user.id,
-        details={
+    audit_actions.append({
+        "action": "user_warn",
+        "target_type": "user",
+        "target_id": user.id,
+        "details": {
             "reason": reason,
             "severity": severity,
             "warning_id": warning.id,
             "user_name": user.display_name,
         },
-    )
+    })
 
     logger.info(f"Admin {admin.user_id} warned user {user.id} ({severity}): {reason}")
 
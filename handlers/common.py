@@ -137,4 +137,7 @@ async def callback_noop(callback: CallbackQuery):
     await callback.answer()
 
 
-
+@router.callback_query()
+async def callback_outdated(callback: CallbackQuery):
+    """Answer callbacks no handler matched, e.g. buttons from old messages."""
+    await callback.answer(MESSAGES["outdated_button"], show_alert=True)
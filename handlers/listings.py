@@ -18,6 +18,7 @@ from keyboards import (
     get_confirm_keyboard,
     get_back_keyboard,
 )
+from keyboards.callbacks import EDIT_FIELDS, callback_prefix, pack_callback, unpack_callback
 from keyboards.keyboards import get_done_keyboard, get_listings_keyboard
 from states import ListingStates
 from utils import format_listing_text, get_category_name
@@ -71,7 +72,7 @@ async def callback_my_active_listings(callback: CallbackQuery):
     text = f"📋 <b>Ваши активные объявления</b> ({len(listings)})\n\n"
     text += "Выберите объявление для просмотра или редактирования:"
     
-    keyboard = get_listings_keyboard(listings, callback_prefix="view_own_listing")
+    keyboard = get_listings_keyboard(listings, action="view_own_listing")
     keyboard.inline_keyboard.append([
         {"text": "◀️ Назад", "callback_data": "my_listings"}
     ])
@@ -101,7 +102,7 @@ async def callback_my_sold_listings(callback: CallbackQuery):
 
     text = f"✅ <b>Ваши проданные товары</b> ({len(listings)})\n\n"
     
-    keyboard = get_listings_keyboard(listings, callback_prefix="view_own_listing")
+    keyboard = get_listings_keyboard(listings, action="view_own_listing")
     keyboard.inline_keyboard.append([
         {"text": "◀️ Назад", "callback_data": "my_listings"}
     ])
@@ -361,10 +362,10 @@ async def confirm_create_listing(callback: CallbackQuery, state: FSMContext):
 
 # ==================== View Listing ====================
 
-@router.callback_query(F.data.startswith("view_listing:"))
+@router.callback_query(F.data.startswith(callback_prefix("view_listing")))
 async def view_listing(callback: CallbackQuery, bot: Bot):
     """View a listing (as a buyer)."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id, with_photos=True, with_user=True)
     
     if not listing:
@@ -422,10 +423,10 @@ async def view_listing(callback: CallbackQuery, bot: Bot):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("view_own_listing:"))
+@router.callback_query(F.data.startswith(callback_prefix("view_own_listing")))
 async def view_own_listing(callback: CallbackQuery, bot: Bot):
     """View own listing (as seller)."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id, with_photos=True)
 
     if not listing:
@@ -507,10 +508,10 @@ async def back_to_listings(callback: CallbackQuery, bot: Bot):
 
 # ==================== Edit Listing ====================
 
-@router.callback_query(F.data.startswith("edit_listing:"))
+@router.callback_query(F.data.startswith(callback_prefix("edit_listing")))
 async def edit_listing_menu(callback: CallbackQuery):
     """Show edit listing menu."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id)
     
     if not listing:
@@ -533,12 +534,11 @@ async def edit_listing_menu(callback: CallbackQuery):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("edit_field:"))
+@router.callback_query(F.data.startswith(callback_prefix("edit_field")))
 async def edit_field(callback: CallbackQuery, state: FSMContext):
     """Start editing a specific field."""
-    parts = callback.data.split(":")
-    field = parts[1]
-    listing_id = int(parts[2])
+    _, (field_index, listing_id) = unpack_callback(callback.data)
+    field = EDIT_FIELDS[field_index]
     
     listing = await Listing.get_by_id(listing_id)
     if not listing:
@@ -552,7 +552,7 @@ async def edit_field(callback: CallbackQuery, state: FSMContext):
         await safe_edit_or_answer(callback,
             f"Текущее название: <b>{listing.title}</b>\n\n"
             f"Введите новое название:",
-            reply_markup=get_back_keyboard(f"edit_listing:{listing_id}"),
+            reply_markup=get_back_keyboard(pack_callback("edit_listing", listing_id)),
             parse_mode="HTML",
         )
     elif field == "description":
@@ -561,7 +561,7 @@ async def edit_field(callback: CallbackQuery, state: FSMContext):
         await safe_edit_or_answer(callback,
             f"Текущее описание: {current_desc}\n\n"
             f"Введите новое описание:",
-            reply_markup=get_back_keyboard(f"edit_listing:{listing_id}"),
+            reply_markup=get_back_keyboard(pack_callback("edit_listing", listing_id)),
             parse_mode="HTML",
         )
     elif field == "price":
@@ -569,7 +569,7 @@ async def edit_field(callback: CallbackQuery, state: FSMContext):
         await safe_edit_or_answer(callback,
             f"Текущая цена: ${listing.price:.2f}\n\n"
             f"Введите новую цену:",
-            reply_markup=get_back_keyboard(f"edit_listing:{listing_id}"),
+            reply_markup=get_back_keyboard(pack_callback("edit_listing", listing_id)),
             parse_mode="HTML",
         )
     elif field == "category":
@@ -589,7 +589,7 @@ async def edit_field(callback: CallbackQuery, state: FSMContext):
             "📷 <b>Управление фото</b>\n\n"
             "Чтобы обновить фото, удалите объявление и создайте новое.\n\n"
             "<i>Полное управление фото будет в будущем обновлении!</i>",
-            reply_markup=get_back_keyboard(f"edit_listing:{listing_id}"),
+            reply_markup=get_back_keyboard(pack_callback("edit_listing", listing_id)),
             parse_mode="HTML",
         )
     
@@ -683,10 +683,10 @@ async def process_edit_category(callback: CallbackQuery, state: FSMContext):
 
 # ==================== Delete Listing ====================
 
-@router.callback_query(F.data.startswith("delete_listing:"))
+@router.callback_query(F.data.startswith(callback_prefix("delete_listing")))
 async def delete_listing_confirm(callback: CallbackQuery):
     """Confirm listing deletion."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id)
     
     if not listing:
@@ -705,18 +705,18 @@ async def delete_listing_confirm(callback: CallbackQuery):
         f"<b>{listing.title}</b>\n\n"
         f"Это действие нельзя отменить.",
         reply_markup=get_confirm_keyboard(
-            confirm_callback=f"confirm_delete:{listing_id}",
-            cancel_callback=f"view_own_listing:{listing_id}",
+            confirm_callback=pack_callback("confirm_delete", listing_id),
+            cancel_callback=pack_callback("view_own_listing", listing_id),
         ),
         parse_mode="HTML",
     )
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("confirm_delete:"))
+@router.callback_query(F.data.startswith(callback_prefix("confirm_delete")))
 async def confirm_delete_listing(callback: CallbackQuery):
     """Delete the listing."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id)
     
     if listing:
@@ -733,10 +733,10 @@ async def confirm_delete_listing(callback: CallbackQuery):
 
 # ==================== Mark as Sold ====================
 
-@router.callback_query(F.data.startswith("mark_sold:"))
+@router.callback_query(F.data.startswith(callback_prefix("mark_sold")))
 async def mark_as_sold(callback: CallbackQuery):
     """Mark listing as sold."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id)
     
     if not listing:
@@ -825,10 +825,10 @@ async def callback_favorites(callback: CallbackQuery):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("add_favorite:"))
+@router.callback_query(F.data.startswith(callback_prefix("add_favorite")))
 async def add_to_favorites(callback: CallbackQuery):
     """Add listing to favorites."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     user = await User.get_by_telegram_id(callback.from_user.id)
 
     await Favorite.add(user.id, listing_id)
@@ -849,10 +849,10 @@ async def add_to_favorites(callback: CallbackQuery):
     await callback.answer(MESSAGES["added_to_favorites"])
 
 
-@router.callback_query(F.data.startswith("remove_favorite:"))
+@router.callback_query(F.data.startswith(callback_prefix("remove_favorite")))
 async def remove_from_favorites(callback: CallbackQuery):
     """Remove listing from favorites."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     user = await User.get_by_telegram_id(callback.from_user.id)
 
     await Favorite.remove(user.id, listing_id)
@@ -8,6 +8,7 @@ from aiogram.fsm.context import FSMContext
 
 from database.models import User, Listing, Message as DBMessage
 from keyboards import get_cancel_keyboard, get_main_menu_keyboard, get_back_keyboard
+from keyboards.callbacks import callback_prefix, unpack_callback
 from states import MessageStates
 from utils import format_listing_short, escape_html
 from utils.helpers import safe_edit_or_answer
@@ -17,10 +18,10 @@ logger = logging.getLogger(__name__)
 router = Router(name="messages")
 
 
-@router.callback_query(F.data.startswith("contact_seller:"))
+@router.callback_query(F.data.startswith(callback_prefix("contact_seller")))
 async def contact_seller(callback: CallbackQuery, state: FSMContext):
     """Start contact seller flow."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
     listing = await Listing.get_by_id(listing_id, with_user=True)
     
     if not listing:
@@ -159,14 +160,14 @@ async def process_buyer_message(message: Message, state: FSMContext, bot: Bot):
 
 # ==================== Reply to Buyer (for future enhancement) ====================
 
-@router.callback_query(F.data.startswith("reply_to_buyer:"))
+@router.callback_query(F.data.startswith(callback_prefix("reply_to_buyer")))
 async def reply_to_buyer(callback: CallbackQuery, state: FSMContext):
     """Start reply to buyer flow."""
     # This is a placeholder for future enhancement
     # In a full implementation, this would allow sellers to reply through the bot
-    parts = callback.data.split(":")
-    buyer_id = int(parts[1])
-    listing_id = int(parts[2]) if len(parts) > 2 else None
+    _, ids = unpack_callback(callback.data)
+    buyer_id = ids[0]
+    listing_id = ids[1] if len(ids) > 1 else None
     
     await state.set_state(MessageStates.waiting_for_reply)
     await state.update_data(
@@ -12,6 +12,7 @@ from keyboards import (
     get_back_keyboard,
     get_cancel_keyboard,
 )
+from keyboards.callbacks import pack_callback
 from keyboards.keyboards import remove_keyboard
 from states import ProfileStates
 from utils.helpers import format_user_profile, escape_html, safe_edit_or_answer
@@ -79,7 +80,7 @@ def get_profile_keyboard(user_id: int = None):
     )
     if user_id is not None:
         builder.row(
-            InlineKeyboardButton(text="⭐ Мои отзывы", callback_data=f"seller_reviews:{user_id}"),
+            InlineKeyboardButton(text="⭐ Мои отзывы", callback_data=pack_callback("seller_reviews", user_id)),
         )
     builder.row(
         InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
@@ -17,6 +17,7 @@ from keyboards import (
     get_pagination_keyboard,
     get_confirm_keyboard,
 )
+from keyboards.callbacks import callback_prefix, pack_callback, unpack_callback
 from states import ReviewStates
 from utils import format_review_text, escape_html
 from utils.helpers import safe_edit_or_answer
@@ -30,10 +31,10 @@ REVIEWS_PER_PAGE = PAGE_SIZE
 
 # ==================== Leave Review ====================
 
-@router.callback_query(F.data.startswith("leave_review:"))
+@router.callback_query(F.data.startswith(callback_prefix("leave_review")))
 async def leave_review(callback: CallbackQuery, state: FSMContext):
     """Start the review flow for a listing's seller."""
-    listing_id = int(callback.data.split(":")[1])
+    _, (listing_id,) = unpack_callback(callback.data)
 
     user = await User.get_by_telegram_id(callback.from_user.id)
     listing = await Listing.get_by_id(listing_id, with_user=True)
@@ -71,12 +72,10 @@ async def leave_review(callback: CallbackQuery, state: FSMContext):
 
 # ==================== Process Rating ====================
 
-@router.callback_query(F.data.startswith("review_rating:"), ReviewStates.waiting_for_rating)
+@router.callback_query(F.data.startswith(callback_prefix("review_rating")), ReviewStates.waiting_for_rating)
 async def process_rating(callback: CallbackQuery, state: FSMContext):
     """Process the star rating selection."""
-    parts = callback.data.split(":")
-    rating = int(parts[1])
-    listing_id = int(parts[2])
+    _, (rating, listing_id) = unpack_callback(callback.data)
 
     await state.update_data(rating=rating, listing_id=listing_id)
     await state.set_state(ReviewStates.waiting_for_comment)
@@ -173,19 +172,13 @@ async def skip_comment(callback: CallbackQuery, state: FSMContext):
 
 # ==================== View Seller Reviews ====================
 
-@router.callback_query(F.data.startswith("seller_reviews:"))
+@router.callback_query(F.data.startswith(callback_prefix("seller_reviews")))
 async def view_seller_reviews(callback: CallbackQuery, state: FSMContext):
     """Show seller reviews with pagination."""
-    parts = callback.data.split(":")
-
-    # Handle paginated: seller_reviews:page:{page}:{seller_id}
-    if len(parts) == 4 and parts[1] == "page":
-        page = int(parts[2])
-        seller_id = int(parts[3])
-    else:
-        # Simple: seller_reviews:{seller_id}
-        seller_id = int(parts[1])
-        page = 1
+    # Packed as (seller_id,) or (seller_id, page) for paginated views
+    _, ids = unpack_callback(callback.data)
+    seller_id = ids[0]
+    page = ids[1] if len(ids) > 1 else 1
 
     seller = await User.get_by_id(seller_id)
     if not seller:
@@ -231,7 +224,7 @@ async def view_seller_reviews(callback: CallbackQuery, state: FSMContext):
             builder.row(
                 InlineKeyboardButton(
                     text=f"🗑 Удалить мой отзыв",
-                    callback_data=f"delete_review:{review.id}:{seller_id}"
+                    callback_data=pack_callback("delete_review", review.id, seller_id)
                 )
             )
 
@@ -242,7 +235,7 @@ async def view_seller_reviews(callback: CallbackQuery, state: FSMContext):
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="◀️ Пред.",
-                    callback_data=f"seller_reviews:page:{page - 1}:{seller_id}"
+                    callback_data=pack_callback("seller_reviews", seller_id, page - 1)
                 )
             )
         nav_buttons.append(
@@ -252,7 +245,7 @@ async def view_seller_reviews(callback: CallbackQuery, state: FSMContext):
             nav_buttons.append(
                 InlineKeyboardButton(
                     text="След. ▶️",
-                    callback_data=f"seller_reviews:page:{page + 1}:{seller_id}"
+                    callback_data=pack_callback("seller_reviews", seller_id, page + 1)
                 )
             )
         builder.row(*nav_buttons)
@@ -272,12 +265,10 @@ async def view_seller_reviews(callback: CallbackQuery, state: FSMContext):
 
 # ==================== Delete Review (User) ====================
 
-@router.callback_query(F.data.startswith("delete_review:"))
+@router.callback_query(F.data.startswith(callback_prefix("delete_review")))
 async def delete_review_confirm(callback: CallbackQuery):
     """Ask for confirmation before deleting own review."""
-    parts = callback.data.split(":")
-    review_id = int(parts[1])
-    seller_id = int(parts[2])
+    _, (review_id, seller_id) = unpack_callback(callback.data)
 
     review = await Review.get_by_id(review_id)
     if not review:
@@ -303,20 +294,18 @@ async def delete_review_confirm(callback: CallbackQuery):
         callback,
         text,
         reply_markup=get_confirm_keyboard(
-            confirm_callback=f"confirm_delete_review:{review_id}:{seller_id}",
-            cancel_callback=f"seller_reviews:{seller_id}",
+            confirm_callback=pack_callback("confirm_delete_review", review_id, seller_id),
+            cancel_callback=pack_callback("seller_reviews", seller_id),
         ),
         parse_mode="HTML",
     )
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("confirm_delete_review:"))
+@router.callback_query(F.data.startswith(callback_prefix("confirm_delete_review")))
 async def confirm_delete_review(callback: CallbackQuery):
     """Execute review deletion after confirmation."""
-    parts = callback.data.split(":")
-    review_id = int(parts[1])
-    seller_id = int(parts[2])
+    _, (review_id, seller_id) = unpack_callback(callback.data)
 
     review = await Review.get_by_id(review_id)
     if not review:
@@ -335,14 +324,14 @@ async def confirm_delete_review(callback: CallbackQuery):
         await safe_edit_or_answer(
             callback,
             "✅ Отзыв успешно удалён.",
-            reply_markup=get_back_keyboard(f"seller_reviews:{seller_id}"),
+            reply_markup=get_back_keyboard(pack_callback("seller_reviews", seller_id)),
             parse_mode="HTML",
         )
     else:
         await safe_edit_or_answer(
             callback,
             "❌ Не удалось удалить отзыв. Попробуйте позже.",
-            reply_markup=get_back_keyboard(f"seller_reviews:{seller_id}"),
+            reply_markup=get_back_keyboard(pack_callback("seller_reviews", seller_id)),
             parse_mode="HTML",
         )
     await callback.answer()
@@ -1,9 +1,12 @@
 """
 Handlers for search and filtering functionality.
 """
+import asyncio
 import logging
+import re
+from typing import Final
 from aiogram import Router, F
-from aiogram.types import Message, CallbackQuery
+from aiogram.types import Message, CallbackQuery, InlineKeyboardButton
 from aiogram.fsm.context import FSMContext
 
 from database.models import User, Listing
@@ -30,6 +33,19 @@ from config import PAGE_SIZE
 logger = logging.getLogger(__name__)
 router = Router(name="search")
 
+_SEARCH_MENU_TEXT: Final = "🔍 <b>Поиск объявлений</b>\n\nКак вы хотите искать?"
+_NO_RESULTS_SUFFIX: Final = "\n<i>Попробуйте другие фильтры или поисковые запросы.</i>"
+_PICK_LISTING_SUFFIX: Final = "\n<i>Выберите объявление для просмотра:</i>"
+
+# Accepted price bound in price_range callbacks
+_PRICE_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Navigation row appended to single-page results
+_FALLBACK_NAV_ROW = [
+    InlineKeyboardButton(text="◀️ Меню", callback_data="back_to_menu"),
+    InlineKeyboardButton(text="🔍 Новый поиск", callback_data="search"),
+]
+
 
 # ==================== Search Menu ====================
 
@@ -38,8 +54,7 @@ async def cmd_search(message: Message, state: FSMContext):
     """Handle /search command."""
     await state.clear()
     await message.answer(
-        "🔍 <b>Поиск объявлений</b>\n\n"
-        "Как вы хотите искать?",
+        _SEARCH_MENU_TEXT,
         reply_markup=get_search_keyboard(),
         parse_mode="HTML",
     )
@@ -51,8 +66,7 @@ async def callback_search(callback: CallbackQuery, state: FSMContext):
     await state.clear()
     await safe_edit_or_answer(
         callback,
-        "🔍 <b>Поиск объявлений</b>\n\n"
-        "Как вы хотите искать?",
+        _SEARCH_MENU_TEXT,
         reply_markup=get_search_keyboard(),
         parse_mode="HTML",
     )
@@ -145,10 +159,10 @@ async def search_by_category(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("browse_category:"))
-async def process_category_browse(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(F.data.regexp(r"^browse_category:(?P<category>\w+)$").as_("m"))
+async def process_category_browse(callback: CallbackQuery, state: FSMContext, m: re.Match):
     """Process category selection."""
-    category = callback.data.split(":")[1]
+    category = m["category"]
     
     if category == "all":
         await state.update_data(search_category=None)
@@ -176,10 +190,10 @@ async def search_by_price(callback: CallbackQuery, state: FSMContext):
     await callback.answer()
 
 
-@router.callback_query(F.data.startswith("price_range:"))
-async def process_price_range(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(F.data.regexp(r"^price_range:(?P<range>.+)$").as_("m"))
+async def process_price_range(callback: CallbackQuery, state: FSMContext, m: re.Match):
     """Process price range selection."""
-    range_str = callback.data.split(":")[1]
+    range_str = m["range"]
     
     if range_str == "custom":
         await state.set_state(SearchStates.waiting_for_min_price)
@@ -193,9 +207,13 @@ async def process_price_range(callback: CallbackQuery, state: FSMContext):
         await callback.answer()
         return
     
-    parts = range_str.split(":")
-    min_price = float(parts[0]) if parts[0] != "0" else None
-    max_price = float(parts[1]) if parts[1] != "0" else None
+    lo, _, hi = range_str.partition(":")
+    if not (_PRICE_RE.fullmatch(lo) and _PRICE_RE.fullmatch(hi)):
+        await callback.answer("❌ Неверный диапазон цен")
+        return
+
+    min_price = float(lo) if lo != "0" else None
+    max_price = float(hi) if hi != "0" else None
     
     await state.update_data(
         search_min_price=min_price,
@@ -253,6 +271,37 @@ async def process_max_price(message: Message, state: FSMContext):
 
 # ==================== Search Results ====================
 
+async def _fetch_search_page(
+    query: str | None,
+    category: str | None,
+    min_price: float | None,
+    max_price: float | None,
+    offset: int,
+) -> tuple[list[Listing], int]:
+    """
+    Fetch one page of search results together with the total count.
+
+    The first page runs both queries concurrently. Deeper pages count
+    first and skip the page query entirely when the offset is past the
+    last result (stale or hand-crafted ``search:page:N`` callbacks).
+    """
+    filters = dict(query=query, category=category, min_price=min_price, max_price=max_price)
+
+    if offset == 0:
+        listings, total = await asyncio.gather(
+            Listing.search(**filters, limit=PAGE_SIZE, offset=offset),
+            Listing.count_search(**filters),
+        )
+        return listings, total
+
+    total = await Listing.count_search(**filters)
+    if offset >= total:
+        return [], total
+
+    listings = await Listing.search(**filters, limit=PAGE_SIZE, offset=offset)
+    return listings, total
+
+
 async def show_search_results(callback: CallbackQuery, state: FSMContext):
     """Show search results for callback queries."""
     data = await state.get_data()
@@ -265,22 +314,7 @@ async def show_search_results(callback: CallbackQuery, state: FSMContext):
     
     offset = (page - 1) * PAGE_SIZE
     
-    # Get listings
-    listings = await Listing.search(
-        query=query,
-        category=category,
-        min_price=min_price,
-        max_price=max_price,
-        limit=PAGE_SIZE,
-        offset=offset,
-    )
-    
-    total = await Listing.count_search(
-        query=query,
-        category=category,
-        min_price=min_price,
-        max_price=max_price,
-    )
+    listings, total = await _fetch_search_page(query, category, min_price, max_price, offset)
     
     total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE if total > 0 else 1
     
@@ -294,7 +328,7 @@ async def show_search_results(callback: CallbackQuery, state: FSMContext):
     )
     
     if not listings:
-        text += "\n<i>Попробуйте другие фильтры или поисковые запросы.</i>"
+        text += _NO_RESULTS_SUFFIX
         await safe_edit_or_answer(
             callback,
             text,
@@ -304,22 +338,18 @@ async def show_search_results(callback: CallbackQuery, state: FSMContext):
         await callback.answer()
         return
     
-    text += "\n<i>Выберите объявление для просмотра:</i>"
+    text += _PICK_LISTING_SUFFIX
     
     # Build keyboard with listings
     keyboard = get_listings_keyboard(listings)
     
     # Add pagination
     if total_pages > 1:
-        # Build extra data for pagination callback
-        extra_data = f"{query or ''}|{category or ''}|{min_price or ''}|{max_price or ''}"
-        pagination = get_pagination_keyboard(page, total_pages, "search", extra_data)
+        # Filters live in FSM state, so the callback only carries the page
+        pagination = get_pagination_keyboard(page, total_pages, "search")
         keyboard.inline_keyboard.extend(pagination.inline_keyboard)
     else:
-        keyboard.inline_keyboard.append([
-            {"text": "◀️ Меню", "callback_data": "back_to_menu"},
-            {"text": "🔍 Новый поиск", "callback_data": "search"},
-        ])
+        keyboard.inline_keyboard.append(_FALLBACK_NAV_ROW)
 
     await safe_edit_or_answer(
         callback,
@@ -342,22 +372,7 @@ async def show_search_results_message(message: Message, state: FSMContext):
     
     offset = (page - 1) * PAGE_SIZE
     
-    # Get listings
-    listings = await Listing.search(
-        query=query,
-        category=category,
-        min_price=min_price,
-        max_price=max_price,
-        limit=PAGE_SIZE,
-        offset=offset,
-    )
-    
-    total = await Listing.count_search(
-        query=query,
-        category=category,
-        min_price=min_price,
-        max_price=max_price,
-    )
+    listings, total = await _fetch_search_page(query, category, min_price, max_price, offset)
     
     total_pages = (total + PAGE_SIZE - 1) // PAGE_SIZE if total > 0 else 1
     
@@ -371,7 +386,7 @@ async def show_search_results_message(message: Message, state: FSMContext):
     )
     
     if not listings:
-        text += "\n<i>Попробуйте другие фильтры или поисковые запросы.</i>"
+        text += _NO_RESULTS_SUFFIX
         await message.answer(
             text,
             reply_markup=get_search_keyboard(),
@@ -379,21 +394,17 @@ async def show_search_results_message(message: Message, state: FSMContext):
         )
         return
     
-    text += "\n<i>Выберите объявление для просмотра:</i>"
+    text += _PICK_LISTING_SUFFIX
     
     # Build keyboard with listings
     keyboard = get_listings_keyboard(listings)
     
     # Add pagination
     if total_pages > 1:
-        extra_data = f"{query or ''}|{category or ''}|{min_price or ''}|{max_price or ''}"
-        pagination = get_pagination_keyboard(page, total_pages, "search", extra_data)
+        pagination = get_pagination_keyboard(page, total_pages, "search")
         keyboard.inline_keyboard.extend(pagination.inline_keyboard)
     else:
-        keyboard.inline_keyboard.append([
-            {"text": "◀️ Меню", "callback_data": "back_to_menu"},
-            {"text": "🔍 Новый поиск", "callback_data": "search"},
-        ])
+        keyboard.inline_keyboard.append(_FALLBACK_NAV_ROW)
     
     await message.answer(
         text,
@@ -404,38 +415,25 @@ async def show_search_results_message(message: Message, state: FSMContext):
 
 # ==================== Pagination ====================
 
-@router.callback_query(F.data.startswith("search:page:"))
-async def search_pagination(callback: CallbackQuery, state: FSMContext):
-    """Handle search pagination."""
-    parts = callback.data.split(":")
-    page = int(parts[2])
-    extra_data = parts[3] if len(parts) > 3 else ""
-    
-    # Parse extra data
-    if extra_data:
-        extra_parts = extra_data.split("|")
-        query = extra_parts[0] if extra_parts[0] else None
-        category = extra_parts[1] if len(extra_parts) > 1 and extra_parts[1] else None
-        min_price = float(extra_parts[2]) if len(extra_parts) > 2 and extra_parts[2] else None
-        max_price = float(extra_parts[3]) if len(extra_parts) > 3 and extra_parts[3] else None
-        
-        await state.update_data(
-            search_query=query,
-            search_category=category,
-            search_min_price=min_price,
-            search_max_price=max_price,
-        )
-    
-    await state.update_data(search_page=page)
+@router.callback_query(F.data.regexp(r"^search:page:(?P<page>[1-9]\d*)(?::.*)?$").as_("m"))
+async def search_pagination(callback: CallbackQuery, state: FSMContext, m: re.Match):
+    """Handle search pagination (filters are read from FSM state)."""
+    await state.update_data(search_page=int(m["page"]))
     await show_search_results(callback, state)
 
 
+@router.callback_query(F.data.startswith("search:page:"))
+async def search_pagination_invalid(callback: CallbackQuery):
+    """Reject malformed page numbers without touching state or the database."""
+    await callback.answer("❌ Неверная страница")
+
+
 # ==================== Category Selection from Browse ====================
 
-@router.callback_query(F.data.startswith("category:"))
-async def category_from_main(callback: CallbackQuery, state: FSMContext):
+@router.callback_query(F.data.regexp(r"^category:(?P<category>\w+)$").as_("m"))
+async def category_from_main(callback: CallbackQuery, state: FSMContext, m: re.Match):
     """Handle category selection from main browse."""
-    category = callback.data.split(":")[1]
+    category = m["category"]
     
     await state.update_data(
         search_query=None,
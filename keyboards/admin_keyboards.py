@@ -1,12 +1,16 @@
 """
 Keyboard builders for admin panel.
+
+Keyboards are shared between calls (module constants or lru_cache),
+so callers must not mutate the returned markup.
 """
+from functools import lru_cache
 from aiogram.utils.keyboard import InlineKeyboardBuilder
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
 
 
-def get_admin_main_menu_keyboard() -> InlineKeyboardMarkup:
-    """Get admin main menu keyboard."""
+def _build_admin_main_menu_keyboard() -> InlineKeyboardMarkup:
+    """Build admin main menu keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📊 Панель управления", callback_data="admin_dashboard")
@@ -23,8 +27,16 @@ def get_admin_main_menu_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_admin_users_keyboard() -> InlineKeyboardMarkup:
-    """Get admin users management keyboard."""
+_ADMIN_MAIN_MENU = _build_admin_main_menu_keyboard()
+
+
+def get_admin_main_menu_keyboard() -> InlineKeyboardMarkup:
+    """Get admin main menu keyboard."""
+    return _ADMIN_MAIN_MENU
+
+
+def _build_admin_users_keyboard() -> InlineKeyboardMarkup:
+    """Build admin users management keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📋 Все пользователи", callback_data="admin_users:all")
@@ -38,6 +50,15 @@ def get_admin_users_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+_ADMIN_USERS = _build_admin_users_keyboard()
+
+
+def get_admin_users_keyboard() -> InlineKeyboardMarkup:
+    """Get admin users management keyboard."""
+    return _ADMIN_USERS
+
+
+@lru_cache(maxsize=2048)
 def get_admin_user_actions_keyboard(user_id: int, is_blocked: bool = False) -> InlineKeyboardMarkup:
     """Get actions keyboard for specific user."""
     builder = InlineKeyboardBuilder()
@@ -57,8 +78,8 @@ def get_admin_user_actions_keyboard(user_id: int, is_blocked: bool = False) -> I
     return builder.as_markup()
 
 
-def get_admin_listings_keyboard() -> InlineKeyboardMarkup:
-    """Get admin listings management keyboard."""
+def _build_admin_listings_keyboard() -> InlineKeyboardMarkup:
+    """Build admin listings management keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📋 Все объявления", callback_data="admin_listings:all")
@@ -72,6 +93,15 @@ def get_admin_listings_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+_ADMIN_LISTINGS = _build_admin_listings_keyboard()
+
+
+def get_admin_listings_keyboard() -> InlineKeyboardMarkup:
+    """Get admin listings management keyboard."""
+    return _ADMIN_LISTINGS
+
+
+@lru_cache(maxsize=2048)
 def get_admin_listing_actions_keyboard(listing_id: int, is_flagged: bool = False, status: str = "active") -> InlineKeyboardMarkup:
     """Get actions keyboard for specific listing."""
     builder = InlineKeyboardBuilder()
@@ -95,8 +125,8 @@ def get_admin_listing_actions_keyboard(listing_id: int, is_flagged: bool = False
     return builder.as_markup()
 
 
-def get_admin_transactions_keyboard() -> InlineKeyboardMarkup:
-    """Get admin transactions management keyboard."""
+def _build_admin_transactions_keyboard() -> InlineKeyboardMarkup:
+    """Build admin transactions management keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📋 Все транзакции", callback_data="admin_transactions:all")
@@ -110,8 +140,16 @@ def get_admin_transactions_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_admin_analytics_keyboard() -> InlineKeyboardMarkup:
-    """Get admin analytics keyboard."""
+_ADMIN_TRANSACTIONS = _build_admin_transactions_keyboard()
+
+
+def get_admin_transactions_keyboard() -> InlineKeyboardMarkup:
+    """Get admin transactions management keyboard."""
+    return _ADMIN_TRANSACTIONS
+
+
+def _build_admin_analytics_keyboard() -> InlineKeyboardMarkup:
+    """Build admin analytics keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="👥 Статистика пользователей", callback_data="admin_analytics:users")
@@ -125,8 +163,16 @@ def get_admin_analytics_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def get_admin_audit_log_keyboard() -> InlineKeyboardMarkup:
-    """Get admin audit log keyboard."""
+_ADMIN_ANALYTICS = _build_admin_analytics_keyboard()
+
+
+def get_admin_analytics_keyboard() -> InlineKeyboardMarkup:
+    """Get admin analytics keyboard."""
+    return _ADMIN_ANALYTICS
+
+
+def _build_admin_audit_log_keyboard() -> InlineKeyboardMarkup:
+    """Build admin audit log keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📋 Все действия", callback_data="admin_audit:all")
@@ -141,6 +187,15 @@ def get_admin_audit_log_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+_ADMIN_AUDIT_LOG = _build_admin_audit_log_keyboard()
+
+
+def get_admin_audit_log_keyboard() -> InlineKeyboardMarkup:
+    """Get admin audit log keyboard."""
+    return _ADMIN_AUDIT_LOG
+
+
+@lru_cache(maxsize=2048)
 def get_admin_confirm_keyboard(action: str, target_id: int, confirm_text: str = "Подтвердить", cancel_text: str = "Отмена") -> InlineKeyboardMarkup:
     """Get confirmation keyboard for destructive actions."""
     builder = InlineKeyboardBuilder()
@@ -153,6 +208,7 @@ def get_admin_confirm_keyboard(action: str, target_id: int, confirm_text: str =
     return builder.as_markup()
 
 
+@lru_cache(maxsize=2048)
 def get_admin_warning_severity_keyboard(user_id: int) -> InlineKeyboardMarkup:
     """Get warning severity selection keyboard."""
     builder = InlineKeyboardBuilder()
@@ -167,6 +223,7 @@ def get_admin_warning_severity_keyboard(user_id: int) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+@lru_cache(maxsize=2048)
 def get_admin_pagination_keyboard(
     prefix: str,
     current_page: int,
@@ -276,8 +333,8 @@ def get_admin_listing_list_keyboard(
     return builder.as_markup()
 
 
-def get_admin_reviews_keyboard() -> InlineKeyboardMarkup:
-    """Get admin reviews management keyboard."""
+def _build_admin_reviews_keyboard() -> InlineKeyboardMarkup:
+    """Build admin reviews management keyboard."""
     builder = InlineKeyboardBuilder()
 
     builder.button(text="📋 Все отзывы", callback_data="admin_reviews:all")
@@ -288,6 +345,14 @@ def get_admin_reviews_keyboard() -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
+_ADMIN_REVIEWS = _build_admin_reviews_keyboard()
+
+
+def get_admin_reviews_keyboard() -> InlineKeyboardMarkup:
+    """Get admin reviews management keyboard."""
+    return _ADMIN_REVIEWS
+
+
 def get_admin_review_actions_keyboard(review_id: int) -> InlineKeyboardMarkup:
     """Get actions keyboard for a specific review."""
     builder = InlineKeyboardBuilder()
@@ -338,8 +403,16 @@ def get_admin_review_list_keyboard(
     return builder.as_markup()
 
 
-def get_back_to_admin_keyboard() -> InlineKeyboardMarkup:
-    """Simple back to admin menu keyboard."""
+def _build_back_to_admin_keyboard() -> InlineKeyboardMarkup:
+    """Build back to admin menu keyboard."""
     builder = InlineKeyboardBuilder()
     builder.button(text="« Админ-панель", callback_data="admin_menu")
     return builder.as_markup()
+
+
+_BACK_TO_ADMIN = _build_back_to_admin_keyboard()
+
+
+def get_back_to_admin_keyboard() -> InlineKeyboardMarkup:
+    """Simple back to admin menu keyboard."""
+    return _BACK_TO_ADMIN
@@ -0,0 +1,62 @@
+"""
+Compact callback_data encoding for buttons that carry ids.
+
+Telegram limits callback_data to 64 bytes, so actions are sent as short
+codes and ids in base36: pack_callback("edit_listing", 12345) -> "el:9ix".
+"""
+from typing import Final
+
+# Action name -> short code sent in callback_data
+ACTION_CODES: Final = {
+    "view_listing": "vl",
+    "view_own_listing": "vo",
+    "edit_listing": "el",
+    "edit_field": "ef",
+    "delete_listing": "dl",
+    "confirm_delete": "cd",
+    "mark_sold": "ms",
+    "add_favorite": "fa",
+    "remove_favorite": "fr",
+    "contact_seller": "cs",
+    "reply_to_buyer": "rb",
+    "leave_review": "lr",
+    "review_rating": "rr",
+    "seller_reviews": "sr",
+    "delete_review": "dr",
+    "confirm_delete_review": "cr",
+}
+_CODE_ACTIONS: Final = {code: action for action, code in ACTION_CODES.items()}
+
+# Editable listing fields, sent as their index in "edit_field" callbacks
+EDIT_FIELDS: Final = ("title", "description", "price", "category", "photos")
+
+_BASE36_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def int_to_base36(value: int) -> str:
+    """Encode a non-negative integer in base36."""
+    if value < 0:
+        raise ValueError(f"Cannot encode negative id {value} in callback_data")
+    if value < 36:
+        return _BASE36_DIGITS[value]
+    digits = []
+    while value:
+        value, rem = divmod(value, 36)
+        digits.append(_BASE36_DIGITS[rem])
+    return "".join(reversed(digits))
+
+
+def callback_prefix(action: str) -> str:
+    """Get the callback_data prefix for an action, for F.data.startswith filters."""
+    return f"{ACTION_CODES[action]}:"
+
+
+def pack_callback(action: str, *ids: int) -> str:
+    """Build callback_data from an action name and integer ids."""
+    return ":".join((ACTION_CODES[action], *map(int_to_base36, ids)))
+
+
+def unpack_callback(data: str) -> tuple[str, list[int]]:
+    """Decode callback_data built by pack_callback into (action, ids)."""
+    code, *parts = data.split(":")
+    return _CODE_ACTIONS[code], [int(part, 36) for part in parts]
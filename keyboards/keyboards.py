@@ -1,6 +1,12 @@
 """
 Inline and Reply keyboards for the Telegram Marketplace Bot.
+
+Keyboards are shared between calls (module constants or lru_cache,
+including the per-listing and pagination keyboards), so callers must
+not mutate the returned markup or its rows. get_listings_keyboard is
+the exception: it builds a fresh markup that handlers extend.
 """
+from functools import lru_cache
 from aiogram.types import (
     InlineKeyboardMarkup,
     InlineKeyboardButton,
@@ -8,32 +14,77 @@ from aiogram.types import (
     KeyboardButton,
     ReplyKeyboardRemove,
 )
-from aiogram.utils.keyboard import InlineKeyboardBuilder, ReplyKeyboardBuilder
 from typing import List, Optional
 from config import CATEGORIES, CURRENCY
+from .callbacks import ACTION_CODES, pack_callback
+
+# Navigation buttons shared by many keyboards
+_BACK_TO_MENU_BTN = InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu")
+_BACK_TO_LISTINGS_BTN = InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_listings")
+# Step buttons shared by the creation and review flows
+_CANCEL_BTN = InlineKeyboardButton(text="❌ Отмена", callback_data="cancel")
+_SKIP_BTN = InlineKeyboardButton(text="⏭️ Пропустить", callback_data="skip")
+
+
+def _kb(*rows) -> InlineKeyboardMarkup:
+    """Build an inline markup from button rows."""
+    return InlineKeyboardMarkup(inline_keyboard=list(rows))
+
+
+def _build_main_menu_keyboard() -> InlineKeyboardMarkup:
+    """Build main menu inline keyboard."""
+    return _kb(
+        [
+            InlineKeyboardButton(text="🔍 Обзор объявлений", callback_data="browse"),
+            InlineKeyboardButton(text="🔎 Поиск", callback_data="search"),
+        ],
+        [
+            InlineKeyboardButton(text="📝 Мои объявления", callback_data="my_listings"),
+            InlineKeyboardButton(text="❤️ Избранное", callback_data="favorites"),
+        ],
+        [
+            InlineKeyboardButton(text="➕ Добавить объявление", callback_data="add_listing"),
+        ],
+        [
+            InlineKeyboardButton(text="👤 Мой профиль", callback_data="profile"),
+            InlineKeyboardButton(text="❓ Помощь", callback_data="help"),
+        ],
+    )
+
+
+_MAIN_MENU = _build_main_menu_keyboard()
 
 
 def get_main_menu_keyboard() -> InlineKeyboardMarkup:
     """Get main menu inline keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="🔍 Обзор объявлений", callback_data="browse"),
-        InlineKeyboardButton(text="🔎 Поиск", callback_data="search"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="📝 Мои объявления", callback_data="my_listings"),
-        InlineKeyboardButton(text="❤️ Избранное", callback_data="favorites"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="➕ Добавить объявление", callback_data="add_listing"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="👤 Мой профиль", callback_data="profile"),
-        InlineKeyboardButton(text="❓ Помощь", callback_data="help"),
-    )
-    
-    return builder.as_markup()
+    return _MAIN_MENU
+
+
+# CATEGORIES is fixed at import, so the two-per-row grid is too
+_CATEGORY_PAIRS = [CATEGORIES[i:i + 2] for i in range(0, len(CATEGORIES), 2)]
+
+# Category button rows per callback prefix, built on first use
+_CATEGORY_ROWS_BY_PREFIX: dict[str, tuple[tuple[InlineKeyboardButton, ...], ...]] = {}
+
+
+def _category_rows(callback_prefix: str) -> tuple[tuple[InlineKeyboardButton, ...], ...]:
+    """Get the paired category button rows for a callback prefix."""
+    rows = _CATEGORY_ROWS_BY_PREFIX.get(callback_prefix)
+    if rows is None:
+        rows = tuple(
+            tuple(
+                InlineKeyboardButton(text=cat["name"], callback_data=f"{callback_prefix}:{cat['id']}")
+                for cat in pair
+            )
+            for pair in _CATEGORY_PAIRS
+        )
+        _CATEGORY_ROWS_BY_PREFIX[callback_prefix] = rows
+    return rows
+
+
+# Prefixes used by the bot's handlers are built eagerly at import
+for _prefix in ("category", "browse_category", "new_listing_category", "edit_category"):
+    _category_rows(_prefix)
 
 
 def get_categories_keyboard(
@@ -42,142 +93,139 @@ def get_categories_keyboard(
     include_back: bool = True,
 ) -> InlineKeyboardMarkup:
     """Get categories selection keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    if include_all:
-        builder.row(
-            InlineKeyboardButton(text="📋 Все категории", callback_data=f"{callback_prefix}:all")
-        )
-    
-    # Add categories in pairs
-    for i in range(0, len(CATEGORIES), 2):
-        row_buttons = []
-        for j in range(2):
-            if i + j < len(CATEGORIES):
-                cat = CATEGORIES[i + j]
-                row_buttons.append(
-                    InlineKeyboardButton(
-                        text=cat["name"],
-                        callback_data=f"{callback_prefix}:{cat['id']}"
-                    )
-                )
-        builder.row(*row_buttons)
-    
-    if include_back:
-        builder.row(
-            InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_menu")
-        )
-    
-    return builder.as_markup()
+    all_row = (
+        ([InlineKeyboardButton(text="📋 Все категории", callback_data=f"{callback_prefix}:all")],)
+        if include_all else ()
+    )
+    back_row = (
+        ([InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_menu")],)
+        if include_back else ()
+    )
+
+    return InlineKeyboardMarkup(
+        inline_keyboard=[*all_row, *_category_rows(callback_prefix), *back_row]
+    )
 
 
+@lru_cache(maxsize=256)
 def get_listing_actions_keyboard(listing_id: int, is_owner: bool = False) -> InlineKeyboardMarkup:
     """Get actions keyboard for a listing."""
-    builder = InlineKeyboardBuilder()
-    
     if is_owner:
-        builder.row(
-            InlineKeyboardButton(text="✏️ Редактировать", callback_data=f"edit_listing:{listing_id}"),
-            InlineKeyboardButton(text="🗑️ Удалить", callback_data=f"delete_listing:{listing_id}"),
-        )
-        builder.row(
-            InlineKeyboardButton(text="✅ Отметить как продано", callback_data=f"mark_sold:{listing_id}"),
-        )
+        rows = [
+            [
+                InlineKeyboardButton(text="✏️ Редактировать", callback_data=pack_callback("edit_listing", listing_id)),
+                InlineKeyboardButton(text="🗑️ Удалить", callback_data=pack_callback("delete_listing", listing_id)),
+            ],
+            [
+                InlineKeyboardButton(text="✅ Отметить как продано", callback_data=pack_callback("mark_sold", listing_id)),
+            ],
+        ]
     else:
-        builder.row(
-            InlineKeyboardButton(text="💬 Связаться с продавцом", callback_data=f"contact_seller:{listing_id}"),
-        )
-        builder.row(
-            InlineKeyboardButton(text="❤️ В избранное", callback_data=f"add_favorite:{listing_id}"),
-        )
-
-    builder.row(
-        InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_listings"),
+        rows = [
+            [
+                InlineKeyboardButton(text="💬 Связаться с продавцом", callback_data=pack_callback("contact_seller", listing_id)),
+            ],
+            [
+                InlineKeyboardButton(text="❤️ В избранное", callback_data=pack_callback("add_favorite", listing_id)),
+            ],
+        ]
+
+    rows.append([_BACK_TO_LISTINGS_BTN])
+
+    return _kb(*rows)
+
+
+def _build_my_listings_keyboard() -> InlineKeyboardMarkup:
+    """Build My Listings menu keyboard."""
+    return _kb(
+        [
+            InlineKeyboardButton(text="📋 Активные объявления", callback_data="my_active"),
+        ],
+        [
+            InlineKeyboardButton(text="✅ Проданные товары", callback_data="my_sold"),
+        ],
+        [
+            InlineKeyboardButton(text="➕ Добавить объявление", callback_data="add_listing"),
+        ],
+        [
+            InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
+        ],
     )
-    
-    return builder.as_markup()
+
+
+_MY_LISTINGS = _build_my_listings_keyboard()
 
 
 def get_my_listings_keyboard() -> InlineKeyboardMarkup:
     """Get My Listings menu keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="📋 Активные объявления", callback_data="my_active"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="✅ Проданные товары", callback_data="my_sold"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="➕ Добавить объявление", callback_data="add_listing"),
+    return _MY_LISTINGS
+
+
+def _build_search_keyboard() -> InlineKeyboardMarkup:
+    """Build search options keyboard."""
+    return _kb(
+        [
+            InlineKeyboardButton(text="🔤 Поиск по ключевым словам", callback_data="search_keywords"),
+        ],
+        [
+            InlineKeyboardButton(text="📁 Обзор по категориям", callback_data="search_category"),
+        ],
+        [
+            InlineKeyboardButton(text="💰 Фильтр по цене", callback_data="search_price"),
+        ],
+        [
+            InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
+        ],
     )
-    builder.row(
-        InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
-    )
-    
-    return builder.as_markup()
+
+
+_SEARCH = _build_search_keyboard()
 
 
 def get_search_keyboard() -> InlineKeyboardMarkup:
     """Get search options keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="🔤 Поиск по ключевым словам", callback_data="search_keywords"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="📁 Обзор по категориям", callback_data="search_category"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="💰 Фильтр по цене", callback_data="search_price"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
-    )
-    
-    return builder.as_markup()
+    return _SEARCH
 
 
 def get_confirm_keyboard(confirm_callback: str, cancel_callback: str = "cancel") -> InlineKeyboardMarkup:
     """Get confirmation keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="✅ Подтвердить", callback_data=confirm_callback),
-        InlineKeyboardButton(text="❌ Отмена", callback_data=cancel_callback),
+    return _kb(
+        [
+            InlineKeyboardButton(text="✅ Подтвердить", callback_data=confirm_callback),
+            InlineKeyboardButton(text="❌ Отмена", callback_data=cancel_callback),
+        ],
     )
-    
-    return builder.as_markup()
+
+
+_CANCEL = _kb([_CANCEL_BTN])
 
 
 def get_cancel_keyboard() -> InlineKeyboardMarkup:
     """Get cancel keyboard."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="❌ Отмена", callback_data="cancel"),
-    )
-    return builder.as_markup()
+    return _CANCEL
 
 
+@lru_cache(maxsize=64)
 def get_back_keyboard(callback_data: str = "back_to_menu") -> InlineKeyboardMarkup:
     """Get back button keyboard."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="◀️ Назад", callback_data=callback_data),
+    return _kb(
+        [
+            InlineKeyboardButton(text="◀️ Назад", callback_data=callback_data),
+        ],
     )
-    return builder.as_markup()
 
 
+@lru_cache(maxsize=64)
 def get_skip_keyboard(skip_callback: str = "skip") -> InlineKeyboardMarkup:
     """Get skip button keyboard."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="⏭️ Пропустить", callback_data=skip_callback),
-        InlineKeyboardButton(text="❌ Отмена", callback_data="cancel"),
-    )
-    return builder.as_markup()
+    if skip_callback == _SKIP_BTN.callback_data:
+        skip_btn = _SKIP_BTN
+    else:
+        skip_btn = InlineKeyboardButton(text=_SKIP_BTN.text, callback_data=skip_callback)
+    return _kb([skip_btn, _CANCEL_BTN])
 
 
+@lru_cache(maxsize=256)
 def get_pagination_keyboard(
     current_page: int,
     total_pages: int,
@@ -185,21 +233,20 @@ def get_pagination_keyboard(
     extra_data: str = "",
 ) -> InlineKeyboardMarkup:
     """Get pagination keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    row_buttons = []
-    
+    suffix = f":{extra_data}" if extra_data else ""
+    nav_row = []
+
     # Previous button
     if current_page > 1:
-        row_buttons.append(
+        nav_row.append(
             InlineKeyboardButton(
                 text="◀️ Пред.",
-                callback_data=f"{callback_prefix}:page:{current_page - 1}:{extra_data}"
+                callback_data=f"{callback_prefix}:page:{current_page - 1}{suffix}"
             )
         )
 
     # Page indicator
-    row_buttons.append(
+    nav_row.append(
         InlineKeyboardButton(
             text=f"{current_page}/{total_pages}",
             callback_data="noop"
@@ -208,21 +255,20 @@ def get_pagination_keyboard(
 
     # Next button
     if current_page < total_pages:
-        row_buttons.append(
+        nav_row.append(
             InlineKeyboardButton(
                 text="След. ▶️",
-                callback_data=f"{callback_prefix}:page:{current_page + 1}:{extra_data}"
+                callback_data=f"{callback_prefix}:page:{current_page + 1}{suffix}"
             )
         )
 
-    builder.row(*row_buttons)
-    builder.row(
-        InlineKeyboardButton(text="◀️ В главное меню", callback_data="back_to_menu"),
+    return _kb(
+        nav_row,
+        [_BACK_TO_MENU_BTN],
     )
-    
-    return builder.as_markup()
 
 
+@lru_cache(maxsize=256)
 def get_listing_detail_keyboard(
     listing_id: int,
     is_owner: bool = False,
@@ -230,192 +276,217 @@ def get_listing_detail_keyboard(
     seller_id: int = None,
 ) -> InlineKeyboardMarkup:
     """Get detailed listing view keyboard."""
-    builder = InlineKeyboardBuilder()
-
     if is_owner:
-        builder.row(
-            InlineKeyboardButton(text="✏️ Редактировать", callback_data=f"edit_listing:{listing_id}"),
-            InlineKeyboardButton(text="🗑️ Удалить", callback_data=f"delete_listing:{listing_id}"),
-        )
-        builder.row(
-            InlineKeyboardButton(text="✅ Отметить как продано", callback_data=f"mark_sold:{listing_id}"),
-        )
+        rows = [
+            [
+                InlineKeyboardButton(text="✏️ Редактировать", callback_data=pack_callback("edit_listing", listing_id)),
+                InlineKeyboardButton(text="🗑️ Удалить", callback_data=pack_callback("delete_listing", listing_id)),
+            ],
+            [
+                InlineKeyboardButton(text="✅ Отметить как продано", callback_data=pack_callback("mark_sold", listing_id)),
+            ],
+        ]
     else:
-        builder.row(
-            InlineKeyboardButton(
-                text="💬 Связаться с продавцом",
-                callback_data=f"contact_seller:{listing_id}"
-            ),
-        )
-
         fav_text = "💔 Удалить из избранного" if is_favorite else "❤️ В избранное"
-        fav_callback = f"remove_favorite:{listing_id}" if is_favorite else f"add_favorite:{listing_id}"
-        builder.row(
-            InlineKeyboardButton(text=fav_text, callback_data=fav_callback),
-        )
-        builder.row(
-            InlineKeyboardButton(text="⭐ Оставить отзыв", callback_data=f"leave_review:{listing_id}"),
-        )
+        fav_callback = pack_callback("remove_favorite", listing_id) if is_favorite else pack_callback("add_favorite", listing_id)
+        rows = [
+            [
+                InlineKeyboardButton(
+                    text="💬 Связаться с продавцом",
+                    callback_data=pack_callback("contact_seller", listing_id)
+                ),
+            ],
+            [
+                InlineKeyboardButton(text=fav_text, callback_data=fav_callback),
+            ],
+            [
+                InlineKeyboardButton(text="⭐ Оставить отзыв", callback_data=pack_callback("leave_review", listing_id)),
+            ],
+        ]
 
     if seller_id is not None:
-        builder.row(
+        rows.append([
             InlineKeyboardButton(
                 text="📝 Отзывы о продавце",
-                callback_data=f"seller_reviews:{seller_id}"
+                callback_data=pack_callback("seller_reviews", seller_id)
             ),
-        )
+        ])
+
+    rows.append([_BACK_TO_LISTINGS_BTN])
+
+    return _kb(*rows)
 
-    builder.row(
-        InlineKeyboardButton(text="◀️ Назад", callback_data="back_to_listings"),
-    )
 
-    return builder.as_markup()
+# Button labels in EDIT_FIELDS order
+_EDIT_FIELD_LABELS = ("📝 Название", "📄 Описание", "💰 Цена", "📁 Категория", "📷 Фото")
 
 
+@lru_cache(maxsize=256)
 def get_edit_listing_keyboard(listing_id: int) -> InlineKeyboardMarkup:
     """Get edit listing options keyboard."""
-    builder = InlineKeyboardBuilder()
-    
-    builder.row(
-        InlineKeyboardButton(text="📝 Название", callback_data=f"edit_field:title:{listing_id}"),
-        InlineKeyboardButton(text="📄 Описание", callback_data=f"edit_field:description:{listing_id}"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="💰 Цена", callback_data=f"edit_field:price:{listing_id}"),
-        InlineKeyboardButton(text="📁 Категория", callback_data=f"edit_field:category:{listing_id}"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="📷 Фото", callback_data=f"edit_field:photos:{listing_id}"),
-    )
-    builder.row(
-        InlineKeyboardButton(text="◀️ Назад", callback_data=f"view_listing:{listing_id}"),
+    fields = [
+        InlineKeyboardButton(text=label, callback_data=pack_callback("edit_field", index, listing_id))
+        for index, label in enumerate(_EDIT_FIELD_LABELS)
+    ]
+    return _kb(
+        [fields[0], fields[1]],
+        [fields[2], fields[3]],
+        [fields[4]],
+        [
+            InlineKeyboardButton(text="◀️ Назад", callback_data=pack_callback("view_listing", listing_id)),
+        ],
     )
-    
-    return builder.as_markup()
+
+
+_PRICE_PREFIX = f" - {CURRENCY}"
+
+
+def _price_suffix(price: float) -> str:
+    """Format the price part of a listing button label."""
+    return f"{_PRICE_PREFIX}{price:.2f}"
 
 
 def get_listings_keyboard(
     listings: List,
-    callback_prefix: str = "view_listing",
+    action: str = "view_listing",
     show_price: bool = True,
 ) -> InlineKeyboardMarkup:
     """Get keyboard with listing buttons."""
-    builder = InlineKeyboardBuilder()
-    
-    for listing in listings:
-        text = listing.title[:30]
-        if show_price:
-            text += f" - {CURRENCY}{listing.price:.2f}"
-        builder.row(
+    if action not in ACTION_CODES:
+        raise ValueError(f"Unknown callback action {action!r}; add it to keyboards/callbacks.py ACTION_CODES")
+    return InlineKeyboardMarkup(inline_keyboard=[
+        [
             InlineKeyboardButton(
-                text=text,
-                callback_data=f"{callback_prefix}:{listing.id}"
+                text=f"{listing.title[:30]}{_price_suffix(listing.price)}" if show_price else listing.title[:30],
+                callback_data=pack_callback(action, listing.id)
             )
-        )
-    
-    return builder.as_markup()
+        ]
+        for listing in listings
+    ])
+
+
+# (button text, price_range payload) pairs, laid out two per row
+_PRICE_RANGES = (
+    ("До $25", "0:25"),
+    ("$25 - $50", "25:50"),
+    ("$50 - $100", "50:100"),
+    ("$100 - $500", "100:500"),
+    ("$500+", "500:0"),
+    ("Свой диапазон", "custom"),
+)
 
 
 def get_price_range_keyboard() -> InlineKeyboardMarkup:
     """Get predefined price range options."""
-    builder = InlineKeyboardBuilder()
-    
-    ranges = [
-        ("До $25", "0:25"),
-        ("$25 - $50", "25:50"),
-        ("$50 - $100", "50:100"),
-        ("$100 - $500", "100:500"),
-        ("$500+", "500:0"),
-        ("Свой диапазон", "custom"),
+    rows = [
+        [
+            InlineKeyboardButton(text=text, callback_data=f"price_range:{data}")
+            for text, data in _PRICE_RANGES[i:i + 2]
+        ]
+        for i in range(0, len(_PRICE_RANGES), 2)
     ]
-    
-    for i in range(0, len(ranges), 2):
-        row_buttons = []
-        for j in range(2):
-            if i + j < len(ranges):
-                text, data = ranges[i + j]
-                row_buttons.append(
-                    InlineKeyboardButton(text=text, callback_data=f"price_range:{data}")
-                )
-        builder.row(*row_buttons)
-    
-    builder.row(
+    rows.append([
         InlineKeyboardButton(text="◀️ Назад", callback_data="search"),
-    )
+    ])
 
-    return builder.as_markup()
+    return _kb(*rows)
 
 
+@lru_cache(maxsize=64)
 def get_done_keyboard(done_callback: str = "done") -> InlineKeyboardMarkup:
     """Get done button keyboard (for multi-item selections like photos)."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="✅ Готово", callback_data=done_callback),
-        InlineKeyboardButton(text="❌ Отмена", callback_data="cancel"),
+    return _kb(
+        [InlineKeyboardButton(text="✅ Готово", callback_data=done_callback), _CANCEL_BTN],
     )
-    return builder.as_markup()
 
 
 # Reply keyboard for sharing contact/location
+_SKIP_REPLY_BTN = KeyboardButton(text="⏭️ Пропустить")
+
+
+def _build_share_contact_keyboard() -> ReplyKeyboardMarkup:
+    """Build keyboard for sharing contact."""
+    return ReplyKeyboardMarkup(
+        keyboard=[
+            [KeyboardButton(text="📱 Поделиться контактом", request_contact=True)],
+            [_SKIP_REPLY_BTN],
+        ],
+        resize_keyboard=True,
+        one_time_keyboard=True,
+    )
+
+
+_SHARE_CONTACT = _build_share_contact_keyboard()
+
+
 def get_share_contact_keyboard() -> ReplyKeyboardMarkup:
     """Get keyboard for sharing contact."""
-    builder = ReplyKeyboardBuilder()
-    builder.row(KeyboardButton(text="📱 Поделиться контактом", request_contact=True))
-    builder.row(KeyboardButton(text="⏭️ Пропустить"))
-    return builder.as_markup(resize_keyboard=True, one_time_keyboard=True)
+    return _SHARE_CONTACT
+
+
+def _build_share_location_keyboard() -> ReplyKeyboardMarkup:
+    """Build keyboard for sharing location."""
+    return ReplyKeyboardMarkup(
+        keyboard=[
+            [KeyboardButton(text="📍 Поделиться локацией", request_location=True)],
+            [_SKIP_REPLY_BTN],
+        ],
+        resize_keyboard=True,
+        one_time_keyboard=True,
+    )
+
+
+_SHARE_LOCATION = _build_share_location_keyboard()
 
 
 def get_share_location_keyboard() -> ReplyKeyboardMarkup:
     """Get keyboard for sharing location."""
-    builder = ReplyKeyboardBuilder()
-    builder.row(KeyboardButton(text="📍 Поделиться локацией", request_location=True))
-    builder.row(KeyboardButton(text="⏭️ Пропустить"))
-    return builder.as_markup(resize_keyboard=True, one_time_keyboard=True)
+    return _SHARE_LOCATION
+
 
+# Star labels for ratings 1-5
+_STAR_LABELS = ("⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
 
+
+@lru_cache(maxsize=256)
 def get_rating_keyboard(listing_id: int) -> InlineKeyboardMarkup:
     """Get star rating keyboard (1-5)."""
-    builder = InlineKeyboardBuilder()
-    stars = []
-    for i in range(1, 6):
-        stars.append(
-            InlineKeyboardButton(
-                text="⭐" * i,
-                callback_data=f"review_rating:{i}:{listing_id}"
-            )
-        )
+    stars = [
+        InlineKeyboardButton(text=label, callback_data=pack_callback("review_rating", rating, listing_id))
+        for rating, label in enumerate(_STAR_LABELS, start=1)
+    ]
     # Two per row: 1-2, 3-4, then 5 alone
-    builder.row(stars[0], stars[1])
-    builder.row(stars[2], stars[3])
-    builder.row(stars[4])
-    builder.row(
-        InlineKeyboardButton(text="❌ Отмена", callback_data="cancel"),
+    return _kb(
+        [stars[0], stars[1]],
+        [stars[2], stars[3]],
+        [stars[4]],
+        [_CANCEL_BTN],
     )
-    return builder.as_markup()
+
+
+_REVIEW_COMMENT = get_skip_keyboard("skip_review_comment")
 
 
 def get_review_comment_keyboard() -> InlineKeyboardMarkup:
     """Get keyboard for review comment step (skip or cancel)."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(text="⏭️ Пропустить", callback_data="skip_review_comment"),
-        InlineKeyboardButton(text="❌ Отмена", callback_data="cancel"),
-    )
-    return builder.as_markup()
+    return _REVIEW_COMMENT
 
 
 def get_seller_reviews_keyboard(seller_id: int) -> InlineKeyboardMarkup:
     """Get button to view all seller reviews."""
-    builder = InlineKeyboardBuilder()
-    builder.row(
-        InlineKeyboardButton(
-            text="⭐ Отзывы о продавце",
-            callback_data=f"seller_reviews:{seller_id}"
-        ),
+    return _kb(
+        [
+            InlineKeyboardButton(
+                text="⭐ Отзывы о продавце",
+                callback_data=pack_callback("seller_reviews", seller_id)
+            ),
+        ],
     )
-    return builder.as_markup()
+
+
+_REMOVE_KEYBOARD = ReplyKeyboardRemove()
 
 
 def remove_keyboard() -> ReplyKeyboardRemove:
     """Remove reply keyboard."""
-    return ReplyKeyboardRemove()
+    return _REMOVE_KEYBOARD
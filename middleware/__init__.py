@@ -2,9 +2,10 @@
 Middleware modules for the Telegram Marketplace Bot.
 """
 from .admin_auth import AdminAuthMiddleware
-from .audit_logger import AuditLoggerMiddleware
+from .audit_logger import AuditLoggerMiddleware, flush_audit_log
 
 __all__ = [
     "AdminAuthMiddleware",
     "AuditLoggerMiddleware",
+    "flush_audit_log",
 ]
@@ -1,15 +1,45 @@
 """
 Admin authentication middleware.
 """
-from typing import Callable, Dict, Any, Awaitable
+import time
+from typing import Callable, Dict, Any, Awaitable, Optional, Tuple
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
 from config import ADMIN_TELEGRAM_IDS
 from database.admin_models import AdminUser
+from utils.admin_context import current_admin
 import logging
 
 logger = logging.getLogger(__name__)
 
+# How long a looked-up admin row is reused before hitting the database again
+ADMIN_CACHE_TTL = 60.0
+
+# telegram_id -> (monotonic timestamp, admin row)
+_ADMIN_CACHE: Dict[int, Tuple[float, AdminUser]] = {}
+
+
+async def get_cached_admin(telegram_id: int) -> Optional[AdminUser]:
+    """
+    Get admin by Telegram ID, reusing a recent lookup when possible.
+
+    Admin rows are written by create_admin.py in a separate process, so the
+    cache cannot be invalidated on change: role or status edits take effect
+    within ADMIN_CACHE_TTL seconds. Misses are not cached, so a newly created
+    admin is recognised on their next update.
+    """
+    now = time.monotonic()
+    cached = _ADMIN_CACHE.get(telegram_id)
+    if cached is not None and now - cached[0] < ADMIN_CACHE_TTL:
+        return cached[1]
+
+    admin = await AdminUser.get_by_telegram_id(telegram_id)
+    if admin is None:
+        _ADMIN_CACHE.pop(telegram_id, None)
+    else:
+        _ADMIN_CACHE[telegram_id] = (now, admin)
+    return admin
+
 
 class AdminAuthMiddleware(BaseMiddleware):
     """
@@ -17,6 +47,10 @@ class AdminAuthMiddleware(BaseMiddleware):
     Adds admin object to handler data if user is an admin.
     """
 
+    def __init__(self) -> None:
+        # Bound once so the whitelist check is an attribute lookup
+        self._admin_ids = ADMIN_TELEGRAM_IDS
+
     async def __call__(
         self,
         handler: Callable[[Message | CallbackQuery, Dict[str, Any]], Awaitable[Any]],
@@ -25,18 +59,22 @@ class AdminAuthMiddleware(BaseMiddleware):
     ) -> Any:
         """
         Check if user is admin and add admin object to handler data.
-        Only adds admin/is_admin to data dict if user is actually an admin.
+        Only adds admin to data dict if user is actually an active admin.
         """
         user = event.from_user
 
-        # Check if user is in admin whitelist
-        if user.id in ADMIN_TELEGRAM_IDS:
-            # Get admin from database
-            admin = await AdminUser.get_by_telegram_id(user.id)
+        # Whitelisted users only; the admin row comes from the cache or database
+        admin = None
+        if user.id in self._admin_ids:
+            admin = await get_cached_admin(user.id)
             if admin and admin.is_active:
-                # Only add to data if user is an active admin
                 data["admin"] = admin
-                data["is_admin"] = True
+            else:
+                admin = None
 
-        # Call the handler
-        return await handler(event, data)
+        # Expose the admin to decorators for the duration of the handler
+        token = current_admin.set(admin)
+        try:
+            return await handler(event, data)
+        finally:
+            current_admin.reset(token)
@@ -1,7 +1,8 @@
 """
 Audit logging middleware for admin actions.
 """
-from typing import Callable, Dict, Any, Awaitable
+import asyncio
+from typing import Callable, Dict, Any, Awaitable, List, Set
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery
 from database.admin_models import AdminAuditLog, AdminUser
@@ -9,11 +10,35 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight audit writes so they are not garbage collected
+_PENDING_AUDIT_TASKS: Set[asyncio.Task] = set()
+
+
+def _on_audit_task_done(task: asyncio.Task) -> None:
+    """Forget a finished audit write and report its outcome."""
+    _PENDING_AUDIT_TASKS.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error(f"Failed to log admin action: {exc}")
+
+
+async def flush_audit_log() -> None:
+    """Wait for queued audit writes, e.g. before closing the database."""
+    if _PENDING_AUDIT_TASKS:
+        await asyncio.gather(*_PENDING_AUDIT_TASKS, return_exceptions=True)
+
 
 class AuditLoggerMiddleware(BaseMiddleware):
     """
     Middleware to automatically log admin actions.
-    Logs actions after handler execution if audit_action is set in state data.
+
+    For admin updates an empty ``audit_actions`` list is put into handler
+    data. Handlers that want an action logged declare an ``audit_actions``
+    parameter and append dicts with action/target_type/target_id/details;
+    they are written in the background once the handler returns. No FSM round-trip
+    is needed, so updates that record nothing cost nothing extra.
     """
 
     async def __call__(
@@ -23,41 +48,32 @@ class AuditLoggerMiddleware(BaseMiddleware):
         data: Dict[str, Any]
     ) -> Any:
         """
-        Execute handler and log audit action if set.
+        Execute handler and log any audit actions it recorded.
         """
-        # Call the handler first
+        admin: AdminUser | None = data.get("admin")
+        if admin is None:
+            return await handler(event, data)
+
+        audit_actions: List[Dict[str, Any]] = []
+        data["audit_actions"] = audit_actions
+
         result = await handler(event, data)
 
-        # Check if admin action should be logged
-        if "admin" in data and data["admin"] is not None:
-            admin: AdminUser = data["admin"]
-
-            # Check if state data has audit_action
-            state = data.get("state")
-            if state:
-                state_data = await state.get_data()
-                audit_action = state_data.get("audit_action")
-
-                if audit_action:
-                    try:
-                        # Create audit log entry
-                        await AdminAuditLog.create(
-                            admin_id=admin.user_id,
-                            action=audit_action.get("action", "unknown"),
-                            target_type=audit_action.get("target_type"),
-                            target_id=audit_action.get("target_id"),
-                            details=audit_action.get("details", {})
-                        )
-
-                        logger.info(
-                            f"Admin action logged: {audit_action.get('action')} "
-                            f"by admin {admin.user_id}"
-                        )
-
-                        # Clear audit action from state
-                        await state.update_data(audit_action=None)
-
-                    except Exception as e:
-                        logger.error(f"Failed to log admin action: {e}")
+        # Write entries in the background so the response isn't held up by I/O
+        for audit_action in audit_actions:
+            task = asyncio.create_task(AdminAuditLog.create(
+                admin_id=admin.user_id,
+                action=audit_action.get("action", "unknown"),
+                target_type=audit_action.get("target_type"),
+                target_id=audit_action.get("target_id"),
+                details=audit_action.get("details", {})
+            ))
+            _PENDING_AUDIT_TASKS.add(task)
+            task.add_done_callback(_on_audit_task_done)
+
+            logger.info(
+                f"Admin action queued for audit log: {audit_action.get('action')} "
+                f"by admin {admin.user_id}"
+            )
 
         return result
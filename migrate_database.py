@@ -6,6 +6,19 @@ import asyncio
 import sqlite3
 from database.db import get_db
 
+# Columns added by the admin panel, per table: (name, SQL definition)
+MIGRATION_COLUMNS = {
+    "users": [
+        ("suspension_reason", "TEXT"),
+        ("suspended_until", "TIMESTAMP"),
+        ("warning_count", "INTEGER DEFAULT 0"),
+    ],
+    "listings": [
+        ("flagged", "INTEGER DEFAULT 0"),
+        ("flag_reason", "TEXT"),
+    ],
+}
+
 
 async def migrate():
     """Add admin columns to existing database."""
@@ -16,64 +29,36 @@ async def migrate():
 
     db = await get_db()
 
-    # Get list of columns in users table
-    cursor = await db.connection.execute("PRAGMA table_info(users)")
-    user_columns = await cursor.fetchall()
-    user_column_names = [col[1] for col in user_columns]
-
-    print("Checking users table...")
-
-    # Add suspension_reason column if it doesn't exist
-    if "suspension_reason" not in user_column_names:
-        print("  + Adding suspension_reason column...")
-        await db.connection.execute("ALTER TABLE users ADD COLUMN suspension_reason TEXT")
-        print("    [OK] Added suspension_reason")
-    else:
-        print("  [OK] suspension_reason already exists")
-
-    # Add suspended_until column if it doesn't exist
-    if "suspended_until" not in user_column_names:
-        print("  + Adding suspended_until column...")
-        await db.connection.execute("ALTER TABLE users ADD COLUMN suspended_until TIMESTAMP")
-        print("    [OK] Added suspended_until")
-    else:
-        print("  [OK] suspended_until already exists")
-
-    # Add warning_count column if it doesn't exist
-    if "warning_count" not in user_column_names:
-        print("  + Adding warning_count column...")
-        await db.connection.execute("ALTER TABLE users ADD COLUMN warning_count INTEGER DEFAULT 0")
-        print("    [OK] Added warning_count")
-    else:
-        print("  [OK] warning_count already exists")
-
-    print()
-
-    # Get list of columns in listings table
-    cursor = await db.connection.execute("PRAGMA table_info(listings)")
-    listing_columns = await cursor.fetchall()
-    listing_column_names = [col[1] for col in listing_columns]
-
-    print("Checking listings table...")
-
-    # Add flagged column if it doesn't exist
-    if "flagged" not in listing_column_names:
-        print("  + Adding flagged column...")
-        await db.connection.execute("ALTER TABLE listings ADD COLUMN flagged INTEGER DEFAULT 0")
-        print("    [OK] Added flagged")
-    else:
-        print("  [OK] flagged already exists")
-
-    # Add flag_reason column if it doesn't exist
-    if "flag_reason" not in listing_column_names:
-        print("  + Adding flag_reason column...")
-        await db.connection.execute("ALTER TABLE listings ADD COLUMN flag_reason TEXT")
-        print("    [OK] Added flag_reason")
+    # WAL with synchronous=NORMAL avoids an fsync per statement
+    await db.connection.execute("PRAGMA journal_mode=WAL")
+    await db.connection.execute("PRAGMA synchronous=NORMAL")
+
+    # Introspect both tables up front
+    existing = {}
+    for table in MIGRATION_COLUMNS:
+        cursor = await db.connection.execute(f"PRAGMA table_info({table})")
+        existing[table] = {col[1] for col in await cursor.fetchall()}
+
+    # Work out which columns are missing and report on each table
+    statements = []
+    for table, columns in MIGRATION_COLUMNS.items():
+        print(f"Checking {table} table...")
+        for name, definition in columns:
+            if name in existing[table]:
+                print(f"  [OK] {name} already exists")
+            else:
+                print(f"  + Adding {name} column...")
+                statements.append(f"ALTER TABLE {table} ADD COLUMN {name} {definition};")
+        print()
+
+    # Apply all missing columns in one write transaction
+    if statements:
+        await db.connection.executescript(
+            "\n".join(["BEGIN IMMEDIATE;", *statements, "COMMIT;"])
+        )
+        print(f"  [OK] Added {len(statements)} column(s)")
     else:
-        print("  [OK] flag_reason already exists")
-
-    # Commit changes
-    await db.connection.commit()
+        print("  [OK] Database schema is already up to date")
 
     print()
     print("=" * 60)
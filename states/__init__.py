@@ -7,12 +7,14 @@ from .states import (
     MessageStates,
     ProfileStates,
     ReviewStates,
+    AdminStates,
 )
 
-__all__ = [
+__all__ = (
     "ListingStates",
     "SearchStates",
     "MessageStates",
     "ProfileStates",
     "ReviewStates",
-]
+    "AdminStates",
+)
@@ -1,5 +1,10 @@
 """
 Finite State Machine (FSM) states for handling conversation flows.
+
+States carry short explicit names (e.g. "L:t" for
+ListingStates.waiting_for_title) to keep the strings written to FSM
+storage on every transition small. Handlers always refer to the
+attributes, never to the raw strings.
 """
 from aiogram.fsm.state import State, StatesGroup
 
@@ -7,63 +12,63 @@ from aiogram.fsm.state import State, StatesGroup
 class ListingStates(StatesGroup):
     """States for listing creation and editing."""
     # Creating a new listing
-    waiting_for_title = State()
-    waiting_for_description = State()
-    waiting_for_price = State()
-    waiting_for_category = State()
-    waiting_for_photos = State()
-    waiting_for_location = State()
-    confirm_listing = State()
+    waiting_for_title = State("t", "L")
+    waiting_for_description = State("d", "L")
+    waiting_for_price = State("p", "L")
+    waiting_for_category = State("c", "L")
+    waiting_for_photos = State("ph", "L")
+    waiting_for_location = State("lo", "L")
+    confirm_listing = State("ok", "L")
     
     # Editing an existing listing
-    editing_select_field = State()
-    editing_title = State()
-    editing_description = State()
-    editing_price = State()
-    editing_category = State()
-    editing_photos = State()
+    editing_select_field = State("ef", "L")
+    editing_title = State("et", "L")
+    editing_description = State("ed", "L")
+    editing_price = State("ep", "L")
+    editing_category = State("ec", "L")
+    editing_photos = State("eph", "L")
 
 
 class SearchStates(StatesGroup):
     """States for search and filtering."""
-    waiting_for_query = State()
-    waiting_for_category = State()
-    waiting_for_price_range = State()
-    waiting_for_min_price = State()
-    waiting_for_max_price = State()
-    browsing_results = State()
+    waiting_for_query = State("q", "S")
+    waiting_for_category = State("c", "S")
+    waiting_for_price_range = State("pr", "S")
+    waiting_for_min_price = State("mn", "S")
+    waiting_for_max_price = State("mx", "S")
+    browsing_results = State("br", "S")
 
 
 class MessageStates(StatesGroup):
     """States for buyer-seller communication."""
-    waiting_for_message = State()
-    waiting_for_reply = State()
+    waiting_for_message = State("m", "M")
+    waiting_for_reply = State("r", "M")
 
 
 class ProfileStates(StatesGroup):
     """States for profile editing."""
-    editing_phone = State()
-    editing_location = State()
-    editing_bio = State()
+    editing_phone = State("ph", "P")
+    editing_location = State("lo", "P")
+    editing_bio = State("b", "P")
 
 
 class ReviewStates(StatesGroup):
     """States for leaving seller reviews."""
-    waiting_for_rating = State()
-    waiting_for_comment = State()
+    waiting_for_rating = State("r", "R")
+    waiting_for_comment = State("c", "R")
 
 
 class AdminStates(StatesGroup):
     """States for admin operations."""
     # User management
-    blocking_user = State()
-    warning_user = State()
-    editing_user_profile = State()
+    blocking_user = State("bu", "A")
+    warning_user = State("wu", "A")
+    editing_user_profile = State("eu", "A")
 
     # Listing management
-    flagging_listing = State()
-    editing_listing = State()
-    deleting_listing = State()
+    flagging_listing = State("fl", "A")
+    editing_listing = State("el", "A")
+    deleting_listing = State("dl", "A")
 
     # Analytics filtering
-    filtering_analytics = State()
+    filtering_analytics = State("fa", "A")
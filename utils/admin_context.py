@@ -0,0 +1,13 @@
+"""
+Per-update admin context.
+
+AdminAuthMiddleware resolves the admin once per update and stores it in
+current_admin, so decorators like require_admin can read it without
+another lookup.
+"""
+from contextvars import ContextVar
+from typing import Optional
+from database.admin_models import AdminUser
+
+# Active admin for the update being handled, or None
+current_admin: ContextVar[Optional[AdminUser]] = ContextVar("current_admin", default=None)
@@ -1,11 +1,31 @@
 """
 Helper utility functions for admin panel.
 """
-from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 from database.models import User, Listing
 from database.admin_models import UserWarning, AdminAuditLog
-from utils.helpers import escape_html, format_price, get_category_name
+from utils.helpers import escape_html, format_datetime, render_listing_card
+
+# warning severity -> (emoji, label)
+_SEVERITY_MAP = MappingProxyType({
+    "low": ("⚠️", "Низкая"),
+    "medium": ("⚠️⚠️", "Средняя"),
+    "high": ("⚠️⚠️⚠️", "Высокая"),
+})
+
+# audit log action -> (icon, title)
+_ACTION_DISPLAY = MappingProxyType({
+    "user_block": ("🚫", "User Block"),
+    "user_unblock": ("✅", "User Unblock"),
+    "user_warn": ("⚠️", "User Warn"),
+    "listing_flag": ("🚩", "Listing Flag"),
+    "listing_unflag": ("✓", "Listing Unflag"),
+    "listing_edit": ("✏️", "Listing Edit"),
+    "listing_delete": ("🗑️", "Listing Delete"),
+    "review_delete": ("⭐", "Review Delete"),
+    "profile_edit": ("👤", "Profile Edit"),
+})
 
 
 def format_admin_user_text(user: User, detailed: bool = True) -> str:
@@ -19,47 +39,52 @@ def format_admin_user_text(user: User, detailed: bool = True) -> str:
     Returns:
         Formatted HTML string
     """
-    if detailed:
-        text = f"""
-👤 <b>Пользователь #{user.id}</b>
+    # Fields read more than once, bound to locals
+    user_id, name = user.id, escape_html(user.display_name)
+    is_active, is_verified, warnings = user.is_active, user.is_verified, user.warning_count
 
-<b>Имя:</b> {escape_html(user.display_name)}
-<b>Telegram ID:</b> <code>{user.telegram_id}</code>
-"""
-        if user.username:
-            text += f"<b>Username:</b> @{escape_html(user.username)}\n"
+    if not detailed:
+        # Short format for lists
+        status = "🚫" if not is_active else ("✓" if is_verified else "")
+        warn = f"⚠️{warnings}" if warnings > 0 else ""
+        return f"{status} <b>{name}</b> (ID: {user_id}) {warn}"
 
-        if user.phone:
-            text += f"<b>Телефон:</b> {escape_html(user.phone)}\n"
+    username, phone, location, rating = user.username, user.phone, user.location, user.rating
 
-        if user.location:
-            text += f"<b>Местоположение:</b> {escape_html(user.location)}\n"
+    parts = [
+        f"\n👤 <b>Пользователь #{user_id}</b>\n\n",
+        f"<b>Имя:</b> {name}\n",
+        f"<b>Telegram ID:</b> <code>{user.telegram_id}</code>\n",
+    ]
 
-        status_emoji = "✅" if user.is_active else "🚫"
-        status_text = "Активен" if user.is_active else "Заблокирован"
-        text += f"\n<b>Статус:</b> {status_emoji} {status_text}\n"
+    if username:
+        parts.append(f"<b>Username:</b> @{escape_html(username)}\n")
 
-        if not user.is_active and user.suspension_reason:
-            text += f"<b>Причина блокировки:</b> {escape_html(user.suspension_reason)}\n"
+    if phone:
+        parts.append(f"<b>Телефон:</b> {escape_html(phone)}\n")
 
-        if user.is_verified:
-            text += "✓ <b>Верифицирован</b>\n"
+    if location:
+        parts.append(f"<b>Местоположение:</b> {escape_html(location)}\n")
 
-        if user.rating > 0:
-            text += f"⭐ <b>Рейтинг:</b> {user.rating:.1f} ({user.rating_count})\n"
+    status_emoji = "✅" if is_active else "🚫"
+    status_text = "Активен" if is_active else "Заблокирован"
+    parts.append(f"\n<b>Статус:</b> {status_emoji} {status_text}\n")
 
-        if user.warning_count > 0:
-            text += f"⚠️ <b>Предупреждения:</b> {user.warning_count}\n"
+    if not is_active and user.suspension_reason:
+        parts.append(f"<b>Причина блокировки:</b> {escape_html(user.suspension_reason)}\n")
 
-        text += f"\n<b>Зарегистрирован:</b> {format_datetime(user.created_at)}"
+    if is_verified:
+        parts.append("✓ <b>Верифицирован</b>\n")
 
-    else:
-        # Short format for lists
-        status = "🚫" if not user.is_active else ("✓" if user.is_verified else "")
-        warn = f"⚠️{user.warning_count}" if user.warning_count > 0 else ""
-        text = f"{status} <b>{escape_html(user.display_name)}</b> (ID: {user.id}) {warn}"
+    if rating > 0:
+        parts.append(f"⭐ <b>Рейтинг:</b> {rating:.1f} ({user.rating_count})\n")
+
+    if warnings > 0:
+        parts.append(f"⚠️ <b>Предупреждения:</b> {warnings}\n")
 
-    return text
+    parts.append(f"\n<b>Зарегистрирован:</b> {format_datetime(user.created_at)}")
+
+    return "".join(parts)
 
 
 def format_admin_listing_text(listing: Listing, user: Optional[User] = None, detailed: bool = True) -> str:
@@ -74,129 +99,81 @@ def format_admin_listing_text(listing: Listing, user: Optional[User] = None, det
     Returns:
         Formatted HTML string
     """
-    if detailed:
-        text = f"""
-📝 <b>Объявление #{listing.id}</b>
-
-<b>Название:</b> {escape_html(listing.title)}
-<b>Цена:</b> {format_price(listing.price)}
-<b>Категория:</b> {get_category_name(listing.category)}
-"""
-
-        if listing.location:
-            text += f"<b>Местоположение:</b> {escape_html(listing.location)}\n"
-
-        text += f"\n<b>Описание:</b>\n{escape_html(listing.description or 'Нет описания')}\n"
-
-        # Status
-        status_map = {
-            "active": ("🟢", "Активно"),
-            "sold": ("✅", "Продано"),
-            "reserved": ("🔒", "Зарезервировано"),
-            "deleted": ("🗑️", "Удалено"),
-        }
-        emoji, status_text = status_map.get(listing.status, ("", listing.status))
-        text += f"\n<b>Статус:</b> {emoji} {status_text}\n"
-
-        # Flagged
-        if listing.flagged:
-            text += f"🚩 <b>ОТМЕЧЕНО</b>\n"
-            if listing.flag_reason:
-                text += f"<b>Причина:</b> {escape_html(listing.flag_reason)}\n"
-
-        # Stats
-        text += f"<b>Просмотров:</b> {listing.views}\n"
-
-        # Seller
-        if user:
-            text += f"\n<b>Продавец:</b> {escape_html(user.display_name)} (ID: {user.id})\n"
-        else:
-            text += f"\n<b>Продавец ID:</b> {listing.user_id}\n"
-
-        text += f"<b>Создано:</b> {format_datetime(listing.created_at)}"
-
-    else:
-        # Short format for lists
-        status_icon = "🚩" if listing.flagged else ("🗑️" if listing.status == "deleted" else "")
-        text = f"{status_icon} <b>{escape_html(listing.title[:40])}</b> - {format_price(listing.price)} (ID: {listing.id})"
-
-    return text
+    return render_listing_card(listing, user, detailed, admin=True)
 
 
 def format_admin_warning_text(warning: UserWarning) -> str:
     """Format warning for admin view."""
-    severity_map = {
-        "low": ("⚠️", "Низкая"),
-        "medium": ("⚠️⚠️", "Средняя"),
-        "high": ("⚠️⚠️⚠️", "Высокая"),
-    }
-    emoji, severity_text = severity_map.get(warning.severity, ("⚠️", warning.severity))
-
-    text = f"""
-{emoji} <b>Предупреждение #{warning.id}</b>
-
-<b>Уровень:</b> {severity_text}
-<b>Причина:</b> {escape_html(warning.reason)}
-<b>Статус:</b> {"🟢 Активно" if warning.is_active else "⚫ Снято"}
-"""
+    emoji, severity_text = _SEVERITY_MAP.get(warning.severity, ("⚠️", warning.severity))
+
+    parts = [
+        f"\n{emoji} <b>Предупреждение #{warning.id}</b>\n\n",
+        f"<b>Уровень:</b> {severity_text}\n",
+        f"<b>Причина:</b> {escape_html(warning.reason)}\n",
+        f"<b>Статус:</b> {'🟢 Активно' if warning.is_active else '⚫ Снято'}\n",
+    ]
 
     if warning.admin_user:
-        text += f"<b>Выдал:</b> {escape_html(warning.admin_user.display_name)}\n"
+        parts.append(f"<b>Выдал:</b> {escape_html(warning.admin_user.display_name)}\n")
 
-    text += f"<b>Дата:</b> {format_datetime(warning.created_at)}"
+    parts.append(f"<b>Дата:</b> {format_datetime(warning.created_at)}")
 
     if warning.expires_at:
-        text += f"\n<b>Истекает:</b> {format_datetime(warning.expires_at)}"
+        parts.append(f"\n<b>Истекает:</b> {format_datetime(warning.expires_at)}")
 
-    return text
+    return "".join(parts)
 
 
 def format_admin_audit_log_text(log: AdminAuditLog) -> str:
     """Format audit log entry for admin view."""
-    action_icons = {
-        "user_block": "🚫",
-        "user_unblock": "✅",
-        "user_warn": "⚠️",
-        "listing_flag": "🚩",
-        "listing_unflag": "✓",
-        "listing_edit": "✏️",
-        "listing_delete": "🗑️",
-        "review_delete": "⭐",
-        "profile_edit": "👤",
-    }
-
-    icon = action_icons.get(log.action, "📝")
-
-    text = f"{icon} <b>{log.action.replace('_', ' ').title()}</b>\n"
+    action = log.action
+    icon, title = _ACTION_DISPLAY.get(action) or ("📝", action.replace('_', ' ').title())
+
+    parts = [f"{icon} <b>{title}</b>\n"]
 
     if log.admin_user:
-        text += f"👤 {escape_html(log.admin_user.display_name)}\n"
+        parts.append(f"👤 {escape_html(log.admin_user.display_name)}\n")
 
     if log.target_type and log.target_id:
-        text += f"🎯 {log.target_type.title()} #{log.target_id}\n"
+        parts.append(f"🎯 {log.target_type.title()} #{log.target_id}\n")
 
     # Add details
     if log.details:
         if "reason" in log.details:
-            text += f"📝 {escape_html(log.details['reason'])}\n"
-
-    text += f"🕐 {format_datetime(log.created_at)}"
-
-    return text
-
-
-def format_datetime(dt: Optional[datetime]) -> str:
-    """Format datetime for display."""
-    if dt is None:
-        return "N/A"
-
-    if isinstance(dt, str):
-        try:
-            dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-        except Exception:
-            return dt
-
-    return dt.strftime("%d.%m.%Y %H:%M")
+            parts.append(f"📝 {escape_html(log.details['reason'])}\n")
+
+    parts.append(f"🕐 {format_datetime(log.created_at)}")
+
+    return "".join(parts)
+
+
+# Dashboard template split into (constant text, stats group, stats key)
+# segments; each segment's value follows its text
+_DASHBOARD_SEGMENTS = (
+    ("\n📊 <b>Админ-панель - Главная</b>\n\n<b>👥 Пользователи:</b>\n• Всего: ", "user_stats", "total"),
+    ("\n• Активных: ", "user_stats", "active"),
+    ("\n• Заблокированных: ", "user_stats", "blocked"),
+    ("\n• Верифицированных: ", "user_stats", "verified"),
+    ("\n• Новых сегодня: ", "user_stats", "new_today"),
+    ("\n• Новых за неделю: ", "user_stats", "new_week"),
+    ("\n\n<b>📝 Объявления:</b>\n• Всего: ", "listing_stats", "total"),
+    ("\n• Активных: ", "listing_stats", "active"),
+    ("\n• Продано: ", "listing_stats", "sold"),
+    ("\n• Отмечено флагами: ", "listing_stats", "flagged"),
+    ("\n• Новых сегодня: ", "listing_stats", "new_today"),
+    ("\n• Новых за неделю: ", "listing_stats", "new_week"),
+    ("\n\n<b>💳 Транзакции:</b>\n• Всего: ", "transaction_stats", "total"),
+    ("\n• Ожидают: ", "transaction_stats", "pending"),
+    ("\n• Завершено: ", "transaction_stats", "completed"),
+)
+_DASHBOARD_TAIL = "\n"
+_DASHBOARD_GROUPS = ("user_stats", "listing_stats", "transaction_stats")
+
+# The segments compiled once into a single %-template and its value fields
+_DASHBOARD_TEMPLATE = "".join(
+    text.replace("%", "%%") + "%s" for text, _, _ in _DASHBOARD_SEGMENTS
+) + _DASHBOARD_TAIL
+_DASHBOARD_FIELDS = tuple((group, key) for _, group, key in _DASHBOARD_SEGMENTS)
 
 
 def format_admin_dashboard(stats: dict) -> str:
@@ -209,49 +186,7 @@ def format_admin_dashboard(stats: dict) -> str:
     Returns:
         Formatted HTML string
     """
-    user_stats = stats.get("user_stats", {})
-    listing_stats = stats.get("listing_stats", {})
-    transaction_stats = stats.get("transaction_stats", {})
-
-    text = """
-📊 <b>Админ-панель - Главная</b>
-
-<b>👥 Пользователи:</b>
-• Всего: {total_users}
-• Активных: {active_users}
-• Заблокированных: {blocked_users}
-• Верифицированных: {verified_users}
-• Новых сегодня: {new_users_today}
-• Новых за неделю: {new_users_week}
-
-<b>📝 Объявления:</b>
-• Всего: {total_listings}
-• Активных: {active_listings}
-• Продано: {sold_listings}
-• Отмечено флагами: {flagged_listings}
-• Новых сегодня: {new_listings_today}
-• Новых за неделю: {new_listings_week}
-
-<b>💳 Транзакции:</b>
-• Всего: {total_transactions}
-• Ожидают: {pending_transactions}
-• Завершено: {completed_transactions}
-""".format(
-        total_users=user_stats.get("total", 0),
-        active_users=user_stats.get("active", 0),
-        blocked_users=user_stats.get("blocked", 0),
-        verified_users=user_stats.get("verified", 0),
-        new_users_today=user_stats.get("new_today", 0),
-        new_users_week=user_stats.get("new_week", 0),
-        total_listings=listing_stats.get("total", 0),
-        active_listings=listing_stats.get("active", 0),
-        sold_listings=listing_stats.get("sold", 0),
-        flagged_listings=listing_stats.get("flagged", 0),
-        new_listings_today=listing_stats.get("new_today", 0),
-        new_listings_week=listing_stats.get("new_week", 0),
-        total_transactions=transaction_stats.get("total", 0),
-        pending_transactions=transaction_stats.get("pending", 0),
-        completed_transactions=transaction_stats.get("completed", 0),
-    )
-
-    return text
+    # Resolve each stats group once, then fill the whole template in one
+    # C-level % operation
+    groups = {group: stats.get(group, {}) for group in _DASHBOARD_GROUPS}
+    return _DASHBOARD_TEMPLATE % tuple([groups[group].get(key, 0) for group, key in _DASHBOARD_FIELDS])
@@ -5,6 +5,8 @@ from functools import wraps
 from aiogram import types
 from config import ADMIN_TELEGRAM_IDS, ADMIN_ROLES
 from database.admin_models import AdminUser
+from middleware.admin_auth import get_cached_admin
+from utils.admin_context import current_admin
 import logging
 
 logger = logging.getLogger(__name__)
@@ -29,8 +31,12 @@ def require_admin(handler):
                 await event.answer("⛔ У вас нет доступа к админ-панели.", show_alert=True)
             return
 
-        # Check if user has active admin role in database
-        admin = await AdminUser.get_by_telegram_id(user.id)
+        # The middleware already resolved the admin for this update; fall
+        # back to the TTL cache for handlers outside the admin router
+        kwargs.pop('admin', None)
+        admin = current_admin.get()
+        if admin is None:
+            admin = await get_cached_admin(user.id)
         if not admin or not admin.is_active:
             logger.warning(f"Admin user {user.id} is not active in database")
             if isinstance(event, types.Message):
@@ -39,10 +45,6 @@ def require_admin(handler):
                 await event.answer("⛔ Ваш админ-аккаунт не активен.", show_alert=True)
             return
 
-        # Remove admin from kwargs if it exists (added by middleware)
-        # to avoid duplicate argument error
-        kwargs.pop('admin', None)
-
         # Pass admin object to handler
         return await handler(event, admin, *args, **kwargs)
 
@@ -82,7 +84,7 @@ async def is_admin(user_id: int) -> bool:
     if user_id not in ADMIN_TELEGRAM_IDS:
         return False
 
-    admin = await AdminUser.get_by_telegram_id(user_id)
+    admin = await get_cached_admin(user_id)
     return admin is not None and admin.is_active
 
 
@@ -94,7 +96,7 @@ async def get_admin_user(telegram_id: int) -> AdminUser | None:
     if telegram_id not in ADMIN_TELEGRAM_IDS:
         return None
 
-    admin = await AdminUser.get_by_telegram_id(telegram_id)
+    admin = await get_cached_admin(telegram_id)
     if admin and admin.is_active:
         return admin
 
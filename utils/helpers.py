@@ -1,17 +1,61 @@
 """
 Helper utility functions for the Telegram Marketplace Bot.
+
+The underscore-prefixed formatters are memoized with lru_cache, so their
+arguments must carry everything that affects the output (datetimes are
+keyed by wall-clock time, since aware values for one instant compare equal).
 """
 import html
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from datetime import datetime
 from typing import Optional
 from config import CATEGORIES, CURRENCY
 from database.models import Listing, User
 
+# Category lookups by ID, built once from config.CATEGORIES
+_CAT_NAME = {cat["id"]: cat["name"] for cat in CATEGORIES}
+_CAT_EMOJI = {cat["id"]: cat["emoji"] for cat in CATEGORIES}
+
+# Non-active listing status -> (emoji, label)
+_STATUS_DISPLAY = MappingProxyType({
+    "sold": ("✅", "Продано"),
+    "reserved": ("🔒", "Зарезервировано"),
+    "deleted": ("🗑️", "Удалено"),
+})
+
+# Any listing status -> (emoji, label), for the admin view
+_LISTING_STATUS_MAP = MappingProxyType({
+    "active": ("🟢", "Активно"),
+    **_STATUS_DISPLAY,
+})
+
+# Field label prefixes for the user-facing (False) and admin (True) cards:
+# price, category, location, description
+_LISTING_LABELS = {
+    False: ("💰 <b>Цена:</b> ", "📁 <b>Категория:</b> ", "📍 <b>Местоположение:</b> ", "\n📝 <b>Описание:</b>\n"),
+    True: ("<b>Цена:</b> ", "<b>Категория:</b> ", "<b>Местоположение:</b> ", "\n<b>Описание:</b>\n"),
+}
+
+# Characters html.escape rewrites (with quote=True)
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']")
+
+# Currency symbol, thousands separators and spaces dropped from price input
+_PRICE_STRIP = str.maketrans("", "", "$, ")
+
+
+@lru_cache(maxsize=2048)
+def _esc(s: str) -> str:
+    """Escape HTML special characters in a string."""
+    return html.escape(s)
+
 
 def escape_html(text: str) -> str:
     """Escape HTML special characters."""
-    if text is None:
-        return ""
-    return html.escape(str(text))
+    s = "" if text is None else str(text)
+    # Most fields contain nothing to escape; return them as-is
+    return _esc(s) if _NEEDS_ESCAPE.search(s) else s
 
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
@@ -20,75 +64,151 @@ def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
         return ""
     if len(text) <= max_length:
         return text
-    return text[:max_length - len(suffix)] + suffix
+    if suffix == "...":
+        return f"{text[:max_length - 3]}..."
+    return f"{text[:max_length - len(suffix)]}{suffix}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_price_cached(price: float, currency: str) -> str:
+    """Format a price with a currency symbol."""
+    return f"{currency}{price:,.2f}"
 
 
 def format_price(price: float, currency: str = CURRENCY) -> str:
     """Format price with currency symbol."""
-    return f"{currency}{price:,.2f}"
+    return _fmt_price_cached(price, currency)
 
 
 def get_category_name(category_id: str) -> str:
     """Get category display name by ID."""
-    for cat in CATEGORIES:
-        if cat["id"] == category_id:
-            return cat["name"]
-    return category_id.title()
+    return _CAT_NAME.get(category_id) or category_id.title()
 
 
 def get_category_emoji(category_id: str) -> str:
     """Get category emoji by ID."""
-    for cat in CATEGORIES:
-        if cat["id"] == category_id:
-            return cat["emoji"]
-    return "📦"
+    return _CAT_EMOJI.get(category_id, "📦")
 
 
-def format_listing_text(listing: Listing, user: Optional[User] = None, detailed: bool = True) -> str:
+@lru_cache(maxsize=4096)
+def _fmt_wall_cached(wall: datetime) -> str:
+    """Format a naive datetime for display."""
+    return wall.strftime("%d.%m.%Y %H:%M")
+
+
+def _fmt_dt_cached(dt: datetime) -> str:
+    """Format a datetime by its local wall-clock time."""
+    return _fmt_wall_cached(dt.replace(tzinfo=None))
+
+
+@lru_cache(maxsize=2048)
+def _fmt_iso_str(s: str) -> str:
+    """Parse and format an ISO timestamp string."""
+    try:
+        return datetime.fromisoformat(s.replace('Z', '+00:00')).strftime("%d.%m.%Y %H:%M")
+    except Exception:
+        return s
+
+
+def format_datetime(dt: Optional[datetime]) -> str:
+    """Format datetime for display."""
+    if dt is None:
+        return "N/A"
+
+    if isinstance(dt, str):
+        return _fmt_iso_str(dt)
+
+    return _fmt_dt_cached(dt)
+
+
+def render_listing_card(listing: Listing, user: Optional[User], detailed: bool, admin: bool) -> str:
     """
-    Format listing for display in Telegram message.
-    
+    Render a listing card for the user-facing or admin view.
+
     Args:
-        listing: The listing to format
+        listing: The listing to render
         user: Optional seller user object
-        detailed: Whether to show full details
-    
+        detailed: Whether to render the full card or a one-line summary
+        admin: Whether to render the admin view (status, flags, seller ID)
+
     Returns:
         Formatted HTML string
     """
-    category_name = get_category_name(listing.category)
-    price_text = format_price(listing.price)
-    
-    if detailed:
-        text = f"""
-<b>{escape_html(listing.title)}</b>
+    # format_price / get_category_name inlined: this runs once per listing on every page
+    price_text = _fmt_price_cached(listing.price, CURRENCY)
+    category_name = _CAT_NAME.get(listing.category) or listing.category.title()
+
+    if not detailed:
+        if admin:
+            # Short format for admin lists
+            status_icon = "🚩" if listing.flagged else ("🗑️" if listing.status == "deleted" else "")
+            return f"{status_icon} <b>{escape_html(listing.title[:40])}</b> - {price_text} (ID: {listing.id})"
+        # Short format
+        return f"<b>{escape_html(truncate_text(listing.title, 40))}</b>\n💰 {price_text} | 📁 {category_name}"
+
+    price_label, category_label, location_label, description_label = _LISTING_LABELS[admin]
+    if admin:
+        parts = [
+            f"\n📝 <b>Объявление #{listing.id}</b>\n\n",
+            f"<b>Название:</b> {escape_html(listing.title)}\n",
+        ]
+    else:
+        parts = [f"\n<b>{escape_html(listing.title)}</b>\n\n"]
 
-💰 <b>Цена:</b> {price_text}
-📁 <b>Категория:</b> {category_name}
-"""
+    parts.append(f"{price_label}{price_text}\n")
+    parts.append(f"{category_label}{category_name}\n")
+
+    if listing.location:
+        parts.append(f"{location_label}{escape_html(listing.location)}\n")
+
+    parts.append(f"{description_label}{escape_html(listing.description or 'Нет описания')}\n")
 
-        if listing.location:
-            text += f"📍 <b>Местоположение:</b> {escape_html(listing.location)}\n"
+    if admin:
+        emoji, status_text = _LISTING_STATUS_MAP.get(listing.status, ("", listing.status))
+        parts.append(f"\n<b>Статус:</b> {emoji} {status_text}\n")
 
-        text += f"\n📝 <b>Описание:</b>\n{escape_html(listing.description or 'Нет описания')}\n"
+        if listing.flagged:
+            parts.append("🚩 <b>ОТМЕЧЕНО</b>\n")
+            if listing.flag_reason:
+                parts.append(f"<b>Причина:</b> {escape_html(listing.flag_reason)}\n")
+
+        parts.append(f"<b>Просмотров:</b> {listing.views}\n")
 
         if user:
-            text += f"\n👤 <b>Продавец:</b> {escape_html(user.display_name)}"
-            if user.rating > 0:
-                text += f" ⭐ {user.rating:.1f} ({user.rating_count} отзывов)"
+            parts.append(f"\n<b>Продавец:</b> {escape_html(user.display_name)} (ID: {user.id})\n")
+        else:
+            parts.append(f"\n<b>Продавец ID:</b> {listing.user_id}\n")
 
-        text += f"\n\n👁️ Просмотров: {listing.views}"
+        parts.append(f"<b>Создано:</b> {format_datetime(listing.created_at)}")
+        return "".join(parts)
 
-        if listing.status != "active":
-            status_emoji = "✅" if listing.status == "sold" else "🔒"
-            status_text = "Продано" if listing.status == "sold" else listing.status.title()
-            text += f"\n{status_emoji} Статус: {status_text}"
-    else:
-        # Short format
-        text = f"<b>{escape_html(truncate_text(listing.title, 40))}</b>\n"
-        text += f"💰 {price_text} | 📁 {category_name}"
+    if user:
+        parts.append(f"\n👤 <b>Продавец:</b> {escape_html(user.display_name)}")
+        if user.rating > 0:
+            parts.append(f" ⭐ {user.rating:.1f} ({user.rating_count} отзывов)")
+
+    parts.append(f"\n\n👁️ Просмотров: {listing.views}")
+
+    if listing.status != "active":
+        status_emoji, status_text = _STATUS_DISPLAY.get(listing.status, ("🔒", listing.status.title()))
+        parts.append(f"\n{status_emoji} Статус: {status_text}")
+
+    return "".join(parts)
+
+
+def format_listing_text(listing: Listing, user: Optional[User] = None, detailed: bool = True) -> str:
+    """
+    Format listing for display in Telegram message.
     
-    return text
+    Args:
+        listing: The listing to format
+        user: Optional seller user object
+        detailed: Whether to show full details
+    
+    Returns:
+        Formatted HTML string
+    """
+    return render_listing_card(listing, user, detailed, admin=False)
 
 
 def format_listing_short(listing: Listing) -> str:
@@ -100,31 +220,30 @@ def format_listing_short(listing: Listing) -> str:
 
 def format_user_profile(user: User) -> str:
     """Format user profile for display."""
-    text = f"""
-👤 <b>Ваш профиль</b>
-
-<b>Имя:</b> {escape_html(user.display_name)}
-"""
+    parts = [
+        "\n👤 <b>Ваш профиль</b>\n\n",
+        f"<b>Имя:</b> {escape_html(user.display_name)}\n",
+    ]
 
     if user.username:
-        text += f"<b>Имя пользователя:</b> @{escape_html(user.username)}\n"
+        parts.append(f"<b>Имя пользователя:</b> @{escape_html(user.username)}\n")
 
     if user.phone:
-        text += f"<b>Телефон:</b> {escape_html(user.phone)}\n"
+        parts.append(f"<b>Телефон:</b> {escape_html(user.phone)}\n")
 
     if user.location:
-        text += f"<b>Местоположение:</b> {escape_html(user.location)}\n"
+        parts.append(f"<b>Местоположение:</b> {escape_html(user.location)}\n")
 
     if user.bio:
-        text += f"<b>О себе:</b> {escape_html(user.bio)}\n"
+        parts.append(f"<b>О себе:</b> {escape_html(user.bio)}\n")
 
     if user.rating > 0:
-        text += f"\n⭐ <b>Рейтинг:</b> {user.rating:.1f} ({user.rating_count} отзывов)\n"
+        parts.append(f"\n⭐ <b>Рейтинг:</b> {user.rating:.1f} ({user.rating_count} отзывов)\n")
 
     if user.is_verified:
-        text += "✅ Верифицированный продавец\n"
+        parts.append("✅ Верифицированный продавец\n")
 
-    return text
+    return "".join(parts)
 
 
 def format_review_text(review, reviewer: Optional[User] = None) -> str:
@@ -150,7 +269,7 @@ def format_search_results_header(
     total: int = 0,
 ) -> str:
     """Format search results header."""
-    text = "🔍 <b>Результаты поиска</b>\n\n"
+    parts = ["🔍 <b>Результаты поиска</b>\n\n"]
 
     filters = []
     if query:
@@ -166,11 +285,11 @@ def format_search_results_header(
             filters.append(f"Цена: до {format_price(max_price)}")
 
     if filters:
-        text += "Фильтры: " + ", ".join(filters) + "\n\n"
+        parts.append(f"Фильтры: {', '.join(filters)}\n\n")
 
-    text += f"Найдено <b>{total}</b> объявлений\n"
+    parts.append(f"Найдено <b>{total}</b> объявлений\n")
 
-    return text
+    return "".join(parts)
 
 
 def validate_price(text: str) -> tuple[bool, Optional[float], str]:
@@ -182,7 +301,7 @@ def validate_price(text: str) -> tuple[bool, Optional[float], str]:
     """
     try:
         # Remove currency symbols and whitespace
-        cleaned = text.strip().replace("$", "").replace(",", "").replace(" ", "")
+        cleaned = text.strip().translate(_PRICE_STRIP)
         price = float(cleaned)
 
         if price < 0:
@@ -203,13 +322,14 @@ def validate_title(text: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not text or not text.strip():
+    stripped = text.strip() if text else ""
+    if not stripped:
         return False, "Название не может быть пустым."
 
-    if len(text.strip()) < 3:
+    if len(stripped) < 3:
         return False, "Название должно быть не менее 3 символов."
 
-    if len(text.strip()) > 100:
+    if len(stripped) > 100:
         return False, "Название не может превышать 100 символов."
 
     return True, ""
@@ -222,7 +342,8 @@ def validate_description(text: str) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if text and len(text.strip()) > 2000:
+    stripped = text.strip() if text else ""
+    if len(stripped) > 2000:
         return False, "Описание не может превышать 2000 символов."
 
     return True, ""